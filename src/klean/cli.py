@@ -1080,28 +1080,29 @@ def query_phoenix_traces(limit: int = 500) -> Optional[dict]:
 
 def get_model_health() -> dict[str, str]:
     """Check health of each model via LiteLLM API."""
+    import httpx
+
     health = {}
     models = discover_models()
 
-    for model in models:
-        try:
-            # Quick health check via LiteLLM completion with minimal tokens
-            import httpx
-
-            response = httpx.post(
-                "http://localhost:4000/v1/chat/completions",
-                json={
-                    "model": model,
-                    "messages": [{"role": "user", "content": "Hi"}],
-                    "max_tokens": 5,
-                },
-                timeout=15.0,
-            )
-            health[model] = "OK" if response.status_code == 200 else "FAIL"
-        except httpx.TimeoutException:
-            health[model] = "TIMEOUT"
-        except Exception:
-            health[model] = "ERROR"
+    # Reuse one client so every check shares the same keep-alive connection
+    with httpx.Client(timeout=15.0) as client:
+        for model in models:
+            try:
+                # Quick health check via LiteLLM completion with minimal tokens
+                response = client.post(
+                    "http://localhost:4000/v1/chat/completions",
+                    json={
+                        "model": model,
+                        "messages": [{"role": "user", "content": "Hi"}],
+                        "max_tokens": 5,
+                    },
+                )
+                health[model] = "OK" if response.status_code == 200 else "FAIL"
+            except httpx.TimeoutException:
+                health[model] = "TIMEOUT"
+            except Exception:
+                health[model] = "ERROR"
 
     return health
 
@@ -1508,32 +1509,55 @@ def model_list(test: bool, health: bool):
 
     if test:
         console.print("\n[dim]Testing models (5s timeout, uses tokens)...[/dim]")
-        import urllib.request
-
-        # Test each model and record latency
-        results = []  # [(model, latency_ms or None)]
-        for model in models_list:
+        import http.client
+        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Probes are network-bound, so run them concurrently with one
+        # keep-alive connection per worker thread
+        local = threading.local()
+        connections = []
+        headers = {"Content-Type": "application/json"}
+
+        def probe(model: str) -> Optional[int]:
+            conn = getattr(local, "conn", None)
+            if conn is None:
+                conn = local.conn = http.client.HTTPConnection("localhost", 4000, timeout=5)
+                connections.append(conn)
             try:
-                start = time.time()
+                start = time.perf_counter()
                 data = json.dumps(
                     {
                         "model": model,
                         "messages": [{"role": "user", "content": "1"}],
                         "max_tokens": 1,
                     }
-                ).encode()
-                req = urllib.request.Request(
-                    "http://localhost:4000/chat/completions",
-                    data=data,
-                    headers={"Content-Type": "application/json"},
                 )
-                urllib.request.urlopen(req, timeout=5)
-                latency = int((time.time() - start) * 1000)
-                results.append((model, latency))
-                console.print(f"  [green][OK][/green] {model}: {latency}ms")
+                conn.request("POST", "/chat/completions", body=data, headers=headers)
+                response = conn.getresponse()
+                response.read()  # Drain body so the connection can be reused
+                if response.status >= 400:
+                    return None
+                return int((time.perf_counter() - start) * 1000)
             except Exception:
-                results.append((model, None))
-                console.print(f"  [red]{SYM_FAIL}[/red] {model}: FAIL")
+                conn.close()  # Reconnects on next request
+                return None
+
+        results = []  # [(model, latency_ms or None)]
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(models_list))) as pool:
+                futures = {pool.submit(probe, model): model for model in models_list}
+                for future in as_completed(futures):
+                    model = futures[future]
+                    latency = future.result()
+                    results.append((model, latency))
+                    if latency is not None:
+                        console.print(f"  [green][OK][/green] {model}: {latency}ms")
+                    else:
+                        console.print(f"  [red]{SYM_FAIL}[/red] {model}: FAIL")
+        finally:
+            for conn in connections:
+                conn.close()
 
         # Sort by latency (fastest first), failures last
         results.sort(key=lambda x: (x[1] is None, x[1] if x[1] else 99999))
@@ -2866,7 +2890,7 @@ def get_session_stats() -> dict[str, Any]:
 
 def measure_service_latency(service: str) -> Optional[int]:
     """Measure service response latency in ms."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         if service == "litellm":
             import urllib.request
@@ -2878,7 +2902,7 @@ def measure_service_latency(service: str) -> Optional[int]:
             if socket_path and socket_path.exists():
                 return 1  # Socket exists = fast
             return None
-        return int((time.time() - start) * 1000)
+        return int((time.perf_counter() - start) * 1000)
     except Exception:
         return None
 
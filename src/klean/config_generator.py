@@ -12,6 +12,9 @@ import yaml
 
 from klean.model_utils import extract_model_name, is_thinking_model, parse_model_id
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def generate_litellm_config(models: list[dict]) -> str:
     """Generate litellm config.yaml content.
@@ -268,7 +271,7 @@ def load_config_yaml(config_path: Path) -> dict:
 
     try:
         with open(config_path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
         return data or {"litellm_settings": {"drop_params": True}, "model_list": []}
     except Exception:
         return {"litellm_settings": {"drop_params": True}, "model_list": []}
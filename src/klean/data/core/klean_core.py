@@ -5,6 +5,7 @@ Multi-model code review system with Claude Agent SDK integration
 """
 
 import asyncio
+import heapq
 import json
 import os
 import re
@@ -12,6 +13,7 @@ import sys
 import time
 import urllib.request
 import warnings
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -41,12 +43,27 @@ CONFIG_PATH = Path.home() / ".claude" / "kln" / "config.yaml"
 CACHE_DIR = Path.home() / ".claude" / "kln" / "cache"
 PROMPTS_DIR = Path.home() / ".claude" / "kln" / "prompts"
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Text-format review fields: first token after "GRADE:" / "RISK:" at line start
+GRADE_LINE_RE = re.compile(r"^[ \t]*GRADE:[ \t]*([^\s:]+)", re.MULTILINE)
+RISK_LINE_RE = re.compile(r"^[ \t]*RISK:[ \t]*([^\s:]+)", re.MULTILINE)
+
+# JSON-format review: fenced ```json block, else the outermost {...} span
+JSON_FENCE_RE = re.compile(r"```json?\s*([\s\S]*?)\s*```")
+JSON_BRACE_RE = re.compile(r"\{[\s\S]*\}")
+
+# Rethink idea scoring keywords (built once, not per idea)
+ACTIONABLE_STEP_WORDS = ("run", "check", "look", "grep", "cat", "echo", "print", "log")
+VAGUE_APPROACH_PHRASES = ("check logs", "add logging", "debug more", "try again")
+
 
 def load_config() -> dict:
     """Load K-LEAN configuration"""
     if CONFIG_PATH.exists():
         with open(CONFIG_PATH) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAML_LOADER)
     return {
         "litellm": {"endpoint": "http://localhost:4000", "timeout": 120},
         "models": {"default_single": "auto", "default_multi": 3},
@@ -239,11 +256,11 @@ class ModelResolver:
     def test_latency(self, model_id: str) -> Optional[float]:
         """Test model latency with a simple query"""
         try:
-            start = time.time()
+            start = time.perf_counter()
             self._llm_client.completion(
                 model_id, [{"role": "user", "content": "Hi"}], max_tokens=5, timeout=30
             )
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
 
             # Update cache
             if model_id not in self._models:
@@ -262,8 +279,9 @@ class ModelResolver:
         available = [
             m for m in self._models.values() if m.available and m.latency_ms and m.id not in exclude
         ]
-        sorted_models = sorted(available, key=lambda m: m.latency_ms or float("inf"))
-        return [m.id for m in sorted_models[:count]]
+        # Partial selection instead of sorting every model and slicing
+        fastest = heapq.nsmallest(count, available, key=lambda m: m.latency_ms or float("inf"))
+        return [m.id for m in fastest]
 
     def select_models(
         self,
@@ -341,7 +359,9 @@ class ReviewEngine:
         self.endpoint = CONFIG["litellm"]["endpoint"]
         self.timeout = CONFIG["litellm"].get("timeout", 120)
         self._available_models = None
-        self._llm_client = LLMClient(self.endpoint)
+        # Same endpoint as the resolver's client; share it rather than
+        # configuring litellm a second time
+        self._llm_client = self.resolver._llm_client
 
     def get_available_models(self) -> list[str]:
         """Get available models from LiteLLM (cached)"""
@@ -420,11 +440,11 @@ class ReviewEngine:
         prompt = self._load_prompt(focus, context)
 
         try:
-            start = time.time()
+            start = time.perf_counter()
             result = self._llm_client.completion(
                 model, [{"role": "user", "content": prompt}], max_tokens=4000, timeout=self.timeout
             )
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
 
             # Extract response (handle thinking models)
             content = result["content"] or result.get("reasoning_content") or ""
@@ -450,26 +470,28 @@ class ReviewEngine:
     ) -> dict:
         """Multi-model review with parallel execution"""
 
-        # Resolve models
+        # Resolve models (discovery is blocking HTTP - keep it off the event loop)
         if not models:
-            models = self.resolver.select_models(
-                count=model_count, task=focus, ensure_diversity=True
+            models = await asyncio.to_thread(
+                self.resolver.select_models, count=model_count, task=focus, ensure_diversity=True
             )
 
         # Use JSON format for multi-model to enable proper consensus
         prompt = self._load_prompt(focus, context, output_format=output_format)
+        # Same messages for every model - build once, not per request
+        messages = [{"role": "user", "content": prompt}]
 
         async def run_single(model: str) -> dict:
             """Run single model review async"""
             try:
-                start = time.time()
+                start = time.perf_counter()
                 result = await self._llm_client.acompletion(
                     model,
-                    [{"role": "user", "content": prompt}],
+                    messages,
                     max_tokens=4000,
                     timeout=self.timeout,
                 )
-                latency = (time.time() - start) * 1000
+                latency = (time.perf_counter() - start) * 1000
 
                 # Extract response
                 content = result["content"] or result.get("reasoning_content") or ""
@@ -485,22 +507,14 @@ class ReviewEngine:
                 return {"success": False, "model": model, "error": str(e)}
 
         # Run all models in parallel
-        start_total = time.time()
+        start_total = time.perf_counter()
         results = await asyncio.gather(*[run_single(m) for m in models])
-        total_time = (time.time() - start_total) * 1000
+        total_time = (time.perf_counter() - start_total) * 1000
 
         # Aggregate results
         successful = [r for r in results if r["success"]]
         failed = [r for r in results if not r["success"]]
 
-        # Find consensus issues (mentioned by 2+ models)
-        all_issues = []
-        for r in successful:
-            # Simple extraction of issues (could be smarter)
-            content = r.get("content", "")
-            if "CRITICAL" in content:
-                all_issues.append(("critical", r["model"], content))
-
         return {
             "success": len(successful) > 0,
             "models_used": [r["model"] for r in successful],
@@ -512,14 +526,16 @@ class ReviewEngine:
 
     def _parse_json_review(self, content: str) -> Optional[dict[str, Any]]:
         """Extract and parse JSON from model response"""
-        # Try direct JSON parse first
-        try:
-            return json.loads(content.strip())
-        except json.JSONDecodeError:
-            pass
+        # Try direct JSON parse first (only worth it if it looks like JSON)
+        stripped = content.strip()
+        if stripped[:1] in ("{", "["):
+            try:
+                return json.loads(stripped)
+            except json.JSONDecodeError:
+                pass
 
         # Try to find JSON block in markdown
-        json_match = re.search(r"```json?\s*([\s\S]*?)\s*```", content)
+        json_match = JSON_FENCE_RE.search(content)
         if json_match:
             try:
                 return json.loads(json_match.group(1))
@@ -527,7 +543,7 @@ class ReviewEngine:
                 pass
 
         # Try to find raw JSON object
-        brace_match = re.search(r"\{[\s\S]*\}", content)
+        brace_match = JSON_BRACE_RE.search(content)
         if brace_match:
             try:
                 return json.loads(brace_match.group(0))
@@ -540,12 +556,13 @@ class ReviewEngine:
         """Fallback: extract review data from text format"""
         result = {"grade": None, "risk": None, "findings": [], "summary": ""}
 
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("GRADE:"):
-                result["grade"] = line.split(":")[1].strip().split()[0]
-            elif line.startswith("RISK:"):
-                result["risk"] = line.split(":")[1].strip().split()[0]
+        # Single compiled scan per field; the last GRADE:/RISK: line wins
+        grades = GRADE_LINE_RE.findall(content)
+        if grades:
+            result["grade"] = grades[-1]
+        risks = RISK_LINE_RE.findall(content)
+        if risks:
+            result["risk"] = risks[-1]
 
         # Extract critical issues section
         if "CRITICAL ISSUES:" in content or "CRITICAL:" in content:
@@ -571,11 +588,6 @@ class ReviewEngine:
                 parsed["_format"] = "json"
                 parsed_results.append(parsed)
 
-                if parsed.get("grade"):
-                    grades.append(parsed["grade"])
-                if parsed.get("risk"):
-                    risks.append(parsed["risk"])
-
                 # Collect findings with model attribution
                 for finding in parsed.get("findings", []):
                     finding["_model"] = model
@@ -587,22 +599,16 @@ class ReviewEngine:
                 parsed["_format"] = "text"
                 parsed_results.append(parsed)
 
-                if parsed.get("grade"):
-                    grades.append(parsed["grade"])
-                if parsed.get("risk"):
-                    risks.append(parsed["risk"])
+            if parsed.get("grade"):
+                grades.append(parsed["grade"])
+            if parsed.get("risk"):
+                risks.append(parsed["risk"])
 
-        # Calculate grade consensus
-        grade_counts = {}
-        for g in grades:
-            grade_counts[g] = grade_counts.get(g, 0) + 1
-        consensus_grade = max(grade_counts, key=grade_counts.get) if grade_counts else None
-
-        # Calculate risk consensus
-        risk_counts = {}
-        for r in risks:
-            risk_counts[r] = risk_counts.get(r, 0) + 1
-        consensus_risk = max(risk_counts, key=risk_counts.get) if risk_counts else None
+        # Majority grade/risk (ties go to the first model that reported it)
+        grade_counts = Counter(grades)
+        risk_counts = Counter(risks)
+        consensus_grade = grade_counts.most_common(1)[0][0] if grade_counts else None
+        consensus_risk = risk_counts.most_common(1)[0][0] if risk_counts else None
 
         # Group findings by location similarity
         finding_groups = self._group_similar_findings(all_findings)
@@ -614,44 +620,30 @@ class ReviewEngine:
         low_confidence = []  # Only 1 model found
 
         for group in finding_groups:
-            models_found = len({f.get("_model") for f in group["findings"]})
+            models = [f.get("_model") for f in group["findings"]]
+            models_found = len(set(models))
             representative = group["findings"][0]  # Use first as representative
+            classified = {
+                "issue": representative.get("issue", ""),
+                "location": representative.get("location", ""),
+                "severity": representative.get("severity", ""),
+                "models": models,
+            }
 
             if models_found == total_models:
-                high_confidence.append(
-                    {
-                        "issue": representative.get("issue", ""),
-                        "location": representative.get("location", ""),
-                        "severity": representative.get("severity", ""),
-                        "models": [f.get("_model") for f in group["findings"]],
-                    }
-                )
+                high_confidence.append(classified)
             elif models_found >= 2:
-                medium_confidence.append(
-                    {
-                        "issue": representative.get("issue", ""),
-                        "location": representative.get("location", ""),
-                        "severity": representative.get("severity", ""),
-                        "models": [f.get("_model") for f in group["findings"]],
-                    }
-                )
+                medium_confidence.append(classified)
             else:
-                low_confidence.append(
-                    {
-                        "issue": representative.get("issue", ""),
-                        "location": representative.get("location", ""),
-                        "severity": representative.get("severity", ""),
-                        "models": [f.get("_model") for f in group["findings"]],
-                    }
-                )
+                low_confidence.append(classified)
 
         return {
             "grades": grades,
             "risks": risks,
             "consensus_grade": consensus_grade,
             "consensus_risk": consensus_risk,
-            "grade_agreement": len(set(grades)) == 1 if grades else False,
-            "risk_agreement": len(set(risks)) == 1 if risks else False,
+            "grade_agreement": len(grade_counts) == 1,
+            "risk_agreement": len(risk_counts) == 1,
             "high_confidence": high_confidence,
             "medium_confidence": medium_confidence,
             "low_confidence": low_confidence,
@@ -662,17 +654,17 @@ class ReviewEngine:
     def _group_similar_findings(self, findings: list[dict]) -> list[dict]:
         """Group findings by location and issue similarity"""
         groups = []
+        # Normalized (location, file, issue words) per group, computed once
+        group_keys = []
 
         for finding in findings:
             location = finding.get("location", "").lower()
-            issue = finding.get("issue", "").lower()
+            file_part = location.split(":", 1)[0]
+            words1 = None
 
             # Try to find existing group
             matched = False
-            for group in groups:
-                ref_location = group["location"].lower()
-                ref_issue = group["issue"].lower()
-
+            for group, (ref_location, ref_file, ref_words) in zip(groups, group_keys):
                 # Match by same file:line OR high text similarity
                 if location and ref_location:
                     # Same location
@@ -681,11 +673,11 @@ class ReviewEngine:
                         matched = True
                         break
                     # Same file, similar issue text
-                    if location.split(":")[0] == ref_location.split(":")[0]:
+                    if file_part == ref_file:
                         # Simple word overlap check
-                        words1 = set(issue.split())
-                        words2 = set(ref_issue.split())
-                        overlap = len(words1 & words2) / max(len(words1 | words2), 1)
+                        if words1 is None:
+                            words1 = set(finding.get("issue", "").lower().split())
+                        overlap = len(words1 & ref_words) / max(len(words1 | ref_words), 1)
                         if overlap > 0.5:
                             group["findings"].append(finding)
                             matched = True
@@ -699,6 +691,13 @@ class ReviewEngine:
                         "findings": [finding],
                     }
                 )
+                group_keys.append(
+                    (
+                        location,
+                        file_part,
+                        set(finding.get("issue", "").lower().split()),
+                    )
+                )
 
         return groups
 
@@ -722,7 +721,7 @@ and give a concrete first step. NEVER suggest things already tried."""
         system_prompt = self._load_rethink_prompt()
 
         try:
-            start = time.time()
+            start = time.perf_counter()
             result = self._llm_client.completion(
                 model,
                 [
@@ -733,7 +732,7 @@ and give a concrete first step. NEVER suggest things already tried."""
                 temperature=0.7,  # Higher temp for more creative ideas
                 timeout=self.timeout,
             )
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
 
             # Extract response (handle thinking models)
             content = result["content"] or result.get("reasoning_content") or ""
@@ -754,12 +753,13 @@ and give a concrete first step. NEVER suggest things already tried."""
     ) -> dict:
         """Get fresh perspectives from multiple models in parallel"""
 
-        # Resolve models
+        # Resolve models (discovery is blocking HTTP - keep it off the event loop)
+        available = await asyncio.to_thread(self.get_available_models)
         if models:
             models = [self.resolve_model_name(m) for m in models]
         else:
-            # Auto-select diverse models
-            available = self.resolver.discover_models()
+            # Auto-select diverse models (copy: the cached list must not be shuffled)
+            available = list(available)
             if len(available) >= model_count:
                 # Prefer diversity - mix of thinking and fast models
                 import random
@@ -770,22 +770,24 @@ and give a concrete first step. NEVER suggest things already tried."""
                 models = available
 
         system_prompt = self._load_rethink_prompt()
+        # Same messages for every model - build once, not per request
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": context},
+        ]
 
         async def run_single(model: str) -> dict:
             """Run single model rethink async"""
             try:
-                start = time.time()
+                start = time.perf_counter()
                 result = await self._llm_client.acompletion(
                     model,
-                    [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": context},
-                    ],
+                    messages,
                     max_tokens=4000,
                     temperature=0.7,
                     timeout=self.timeout,
                 )
-                latency = (time.time() - start) * 1000
+                latency = (time.perf_counter() - start) * 1000
 
                 content = result["content"] or result.get("reasoning_content") or ""
 
@@ -801,9 +803,9 @@ and give a concrete first step. NEVER suggest things already tried."""
                 return {"success": False, "model": model, "error": str(e)}
 
         # Run all models in parallel
-        start_total = time.time()
+        start_total = time.perf_counter()
         results = await asyncio.gather(*[run_single(m) for m in models])
-        total_time = (time.time() - start_total) * 1000
+        total_time = (time.perf_counter() - start_total) * 1000
 
         successful = [r for r in results if r["success"]]
         failed = [r for r in results if not r["success"]]
@@ -890,10 +892,7 @@ and give a concrete first step. NEVER suggest things already tried."""
             if idea.get("first_step"):
                 step = idea["first_step"].lower()
                 # Bonus for specific commands/actions
-                if any(
-                    x in step
-                    for x in ["run", "check", "look", "grep", "cat", "echo", "print", "log"]
-                ):
+                if any(x in step for x in ACTIONABLE_STEP_WORDS):
                     score += 3
                 else:
                     score += 1
@@ -906,7 +905,7 @@ and give a concrete first step. NEVER suggest things already tried."""
 
             # Penalize vague suggestions
             approach = (idea.get("approach") or "").lower()
-            if any(x in approach for x in ["check logs", "add logging", "debug more", "try again"]):
+            if any(x in approach for x in VAGUE_APPROACH_PHRASES):
                 score -= 2
 
             idea["_score"] = score
@@ -917,7 +916,7 @@ and give a concrete first step. NEVER suggest things already tried."""
         for idea in sorted(ideas, key=lambda x: x.get("_score", 0), reverse=True):
             approach = (idea.get("approach") or idea.get("first_step") or "").lower()
             # Simple word-based dedup
-            words = set(approach.split()[:5])  # First 5 words
+            words = set(approach.split(None, 5)[:5])  # First 5 words
             words_key = frozenset(words)
 
             # Check for overlap with seen
@@ -1174,17 +1173,20 @@ def cli_multi(args):
         print(f"\n{'=' * 60}")
         print("INDIVIDUAL REVIEWS (use -o json for full details)")
         print(f"{'=' * 60}")
-        for r in result["individual_results"]:
-            if r["success"]:
-                latency = r.get("latency_ms", 0)
-                # Try to get grade from parsed result
-                parsed = engine._parse_json_review(r.get("content", ""))
-                grade = parsed.get("grade", "?") if parsed else "?"
-                risk = parsed.get("risk", "?") if parsed else "?"
-                findings_count = len(parsed.get("findings", [])) if parsed else "?"
-                print(
-                    f"  {r['model']:30} Grade:{grade} Risk:{risk} Findings:{findings_count} ({latency:.0f}ms)"
-                )
+        # Reuse the reviews already parsed for consensus instead of re-parsing.
+        # parsed_results holds one entry per successful result, in order, so
+        # a model listed twice keeps each of its own reviews.
+        successful = [r for r in result["individual_results"] if r["success"]]
+        for r, parsed in zip(successful, consensus.get("parsed_results", [])):
+            latency = r.get("latency_ms", 0)
+            # Only JSON reviews carry a grade, risk and findings list
+            parsed = parsed if parsed["_format"] == "json" else None
+            grade = parsed.get("grade", "?") if parsed else "?"
+            risk = parsed.get("risk", "?") if parsed else "?"
+            findings_count = len(parsed.get("findings", [])) if parsed else "?"
+            print(
+                f"  {r['model']:30} Grade:{grade} Risk:{risk} Findings:{findings_count} ({latency:.0f}ms)"
+            )
 
 
 def cli_rethink(args):
@@ -1201,13 +1203,7 @@ def cli_rethink(args):
     parser.add_argument("--telemetry", action="store_true", help="Enable Phoenix telemetry")
     parsed = parser.parse_args(args)
 
-    engine = ReviewEngine()
-
-    # Setup telemetry if requested (uses litellm.callbacks for full traces)
-    if parsed.telemetry:
-        engine._llm_client.enable_telemetry("kln-rethink")
-
-    # Get context from file or stdin
+    # Get context from file or stdin (validated before any engine/client setup)
     context = ""
     if parsed.context_file:
         try:
@@ -1228,6 +1224,12 @@ def cli_rethink(args):
         print("Use --context-file or pipe context via stdin", file=sys.stderr)
         sys.exit(1)
 
+    engine = ReviewEngine()
+
+    # Setup telemetry if requested (uses litellm.callbacks for full traces)
+    if parsed.telemetry:
+        engine._llm_client.enable_telemetry("kln-rethink")
+
     # Add focus to context if provided
     if parsed.focus:
         context += f"\n\nUser's Focus: {' '.join(parsed.focus)}"
@@ -16,6 +16,7 @@ import os
 import socket
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 # =============================================================================
@@ -222,10 +223,8 @@ def kill_process_tree(pid: int, timeout: float = 5.0) -> bool:
             # Unix: send SIGTERM, wait, then SIGKILL if needed
             os.kill(pid, signal.SIGTERM)
             # Wait for process to terminate
-            import time
-
-            start = time.time()
-            while time.time() - start < timeout:
+            start = time.monotonic()
+            while time.monotonic() - start < timeout:
                 if not is_process_running(pid):
                     return True
                 time.sleep(0.1)
@@ -403,6 +402,17 @@ else:
 KB_DIR_NAME = ".knowledge-db"
 HOST = "127.0.0.1"
 
+# Compact wire encoding for KB server messages (no padding after , and :)
+JSON_SEPARATORS = (",", ":")
+
+# Recent successful pings by port (monotonic timestamp). Only positives are
+# cached so callers polling for a server to come up still see it promptly.
+SERVER_STATUS_TTL = 0.5
+_server_alive_at: dict[int, float] = {}
+
+# Port file path -> (mtime_ns, port) for get_server_port
+_port_cache: dict[Path, tuple[int, int]] = {}
+
 # Project markers in priority order
 PROJECT_MARKERS = [".knowledge-db", ".serena", ".claude", ".git"]
 
@@ -449,7 +459,8 @@ def debug_log(msg: str, category: str = "kb") -> None:
 def get_server_port(project_path: str | Path) -> int | None:
     """Get KB server port for a project.
 
-    Reads port from the port file in runtime directory.
+    Reads port from the port file in runtime directory. The parsed port is
+    cached per port file and reused while the file's mtime is unchanged.
 
     Args:
         project_path: Project root directory
@@ -459,11 +470,21 @@ def get_server_port(project_path: str | Path) -> int | None:
     """
     port_file = get_kb_port_file(Path(project_path))
     try:
-        if port_file.exists():
-            return int(port_file.read_text().strip())
+        mtime_ns = os.stat(port_file).st_mtime_ns
+    except OSError:
+        _port_cache.pop(port_file, None)
+        return None
+
+    cached = _port_cache.get(port_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        port = int(port_file.read_text().strip())
     except (ValueError, OSError):
-        pass
-    return None
+        return None
+    _port_cache[port_file] = (mtime_ns, port)
+    return port
 
 
 def get_pid_path(project_path: str | Path) -> str:
@@ -519,17 +540,27 @@ def is_server_running(project_path: str | Path, timeout: float = 0.5) -> bool:
     if not port:
         return False
 
+    alive_at = _server_alive_at.get(port)
+    if alive_at is not None and time.monotonic() - alive_at < SERVER_STATUS_TTL:
+        return True
+
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(timeout)
         sock.connect((HOST, port))
         sock.sendall(b'{"cmd":"ping"}')
-        response = sock.recv(1024).decode()
+        response = sock.recv(1024)
         sock.close()
-        return '"pong"' in response
     except Exception:
+        _server_alive_at.pop(port, None)
         return False
 
+    if b'"pong"' in response:
+        _server_alive_at[port] = time.monotonic()
+        return True
+    _server_alive_at.pop(port, None)
+    return False
+
 
 def clean_stale_socket(project_path: str | Path) -> bool:
     """Remove stale port/pid files if server not responding.
@@ -561,6 +592,29 @@ def clean_stale_socket(project_path: str | Path) -> bool:
 # =============================================================================
 # TCP Communication
 # =============================================================================
+def recv_all(sock: socket.socket, bufsize: int = 65536) -> bytes:
+    """Read a full response from a KB server connection.
+
+    The server sends one JSON response per connection and then closes it,
+    so reading until EOF always yields the complete payload - including
+    search/recent responses larger than a single recv() buffer.
+
+    Args:
+        sock: Connected socket with the request already sent
+        bufsize: Per-recv chunk size
+
+    Returns:
+        Raw response bytes
+    """
+    chunks = []
+    while True:
+        chunk = sock.recv(bufsize)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 def send_command(project_path: str | Path, cmd_data: dict, timeout: float = 5.0) -> dict | None:
     """Send command to KB server for a project.
 
@@ -580,11 +634,12 @@ def send_command(project_path: str | Path, cmd_data: dict, timeout: float = 5.0)
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(timeout)
         sock.connect((HOST, port))
-        sock.sendall(json.dumps(cmd_data).encode("utf-8"))
-        response = sock.recv(65536).decode("utf-8")
+        sock.sendall(json.dumps(cmd_data, separators=JSON_SEPARATORS).encode("utf-8"))
+        response = recv_all(sock)
         sock.close()
         return json.loads(response)
     except Exception as e:
+        _server_alive_at.pop(port, None)
         debug_log(f"Send command failed: {e}")
         return {"error": str(e)}
 
@@ -8,6 +8,7 @@ Supports both simple CLI input and structured JSON for Claude integration.
 Usage:
   knowledge-capture.py <content> [--type TYPE] [--tags TAG1,TAG2] [--priority LEVEL] [--url URL]
   knowledge-capture.py --json-input '<json>' [--json]
+  knowledge-capture.py --json-input '[<json>, <json>, ...]' [--json]
 
 Types: warning, solution, pattern, finding (auto-inferred if omitted)
 Priority: critical, high, medium, low
@@ -30,9 +31,10 @@ Examples:
 import argparse
 import json
 import os
-import subprocess
 import sys
+import time
 from datetime import datetime
+from itertools import chain, count
 from pathlib import Path
 
 # Import shared utilities
@@ -44,6 +46,7 @@ try:
         get_socket_path,
         infer_type,
         is_server_running,
+        send_command,
     )
 except ImportError:
     sys.path.insert(0, str(Path(__file__).parent))
@@ -52,19 +55,31 @@ except ImportError:
         debug_log,
         infer_type,
         is_server_running,
+        send_command,
     )
 
 
+# Per-process sequence for new_entry_id
+_entry_seq = count()
+
+
 # Result of initialization
 class InitResult:
     def __init__(self, path, newly_created=False, server_started=False):
         self.path = path
         self.newly_created = newly_created
         self.server_started = server_started
+        # Derived paths, computed once per run
+        self.project_path = str(path.parent)
+        self.entries_file = path / "entries.jsonl"
+        self.timeline_file = path / "timeline.txt"
 
 
 def start_kb_server(project_path):
     """Start the KB server for a project."""
+    # Only needed when the server is down; keeps subprocess off the startup path
+    import subprocess
+
     # Import KB_SCRIPTS_DIR from kb_utils (set from environment)
     from kb_utils import KB_SCRIPTS_DIR
 
@@ -83,11 +98,11 @@ def start_kb_server(project_path):
             start_new_session=True,
         )
 
-        # Wait briefly for server to start
-        import time
-
-        for _ in range(10):  # Wait up to 5 seconds
-            time.sleep(0.5)
+        # Wait briefly for server to start. Poll finely so a fast startup is
+        # noticed within ~0.1s; until the port file exists each check is a stat.
+        deadline = time.monotonic() + 5.0  # Wait up to 5 seconds
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
             if is_server_running(project_path):
                 return True
         debug_log("KB server failed to start within timeout")
@@ -126,8 +141,20 @@ def get_knowledge_dir():
     return InitResult(knowledge_db, newly_created, server_started)
 
 
-def create_entry(content, entry_type="finding", tags=None, priority="medium", url=None):
+def new_entry_id(entry_type):
+    """Generate a unique entry ID: "<type>-<ns>-<pid>-<seq>", numbers in hex.
+
+    Unlike a seconds timestamp this cannot collide between entries captured
+    in the same second, whether in one batch or in concurrent processes.
+    """
+    return f"{entry_type}-{time.time_ns():x}-{os.getpid():x}-{next(_entry_seq):x}"
+
+
+def create_entry(content, entry_type="finding", tags=None, priority="medium", url=None, now=None):
     """Create a knowledge database entry (simple mode, V3 schema)."""
+    now = now or datetime.now()
+    date_str = now.strftime("%Y-%m-%d")
+
     if tags is None:
         tags = []
     elif isinstance(tags, str):
@@ -137,74 +164,80 @@ def create_entry(content, entry_type="finding", tags=None, priority="medium", ur
     if entry_type in ("lesson", "best-practice"):
         entry_type = "finding"
 
-    # Generate a unique ID
-    entry_id = f"{entry_type}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    entry_id = new_entry_id(entry_type)
 
     # V3 Schema
     entry = {
         "id": entry_id,
-        "title": content[:100] if len(content) <= 100 else content[:97] + "...",
+        "title": content if len(content) <= 100 else content[:97] + "...",
         "insight": content,
         "type": entry_type,
         "priority": priority,
         "keywords": tags[:10],
-        "source": url or f"conv:{datetime.now().strftime('%Y-%m-%d')}",
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "source": url or f"conv:{date_str}",
+        "date": date_str,
     }
 
     return entry
 
 
-def create_entry_from_json(data: dict):
+def create_entry_from_json(data: dict, now=None):
     """Create a knowledge database entry from structured JSON.
 
     Always outputs V3 schema, but accepts both V2 and V3 input field names.
     V3 Schema: id, title, insight, type, priority, keywords, source, date
     """
+    now = now or datetime.now()
+    date_str = now.strftime("%Y-%m-%d")
+
+    title = data.get("title", "")
+    # Merge insight sources: insight > atomic_insight > summary
+    insight = data.get("insight") or data.get("atomic_insight") or data.get("summary") or ""
+
     entry_type = data.get("type", "")
 
-    # Normalize legacy types or infer from content
+    # Normalize legacy types or infer from content (V3 types skip inference)
     if not entry_type or entry_type in ("lesson", "best-practice"):
-        title = data.get("title", "")
-        insight = data.get("insight") or data.get("atomic_insight") or data.get("summary") or ""
-        entry_type = infer_type(title, insight)
-
-    entry_id = data.get("id") or f"{entry_type}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # Nothing to scan for signal words: infer_type would fall back anyway
+        entry_type = infer_type(title, insight) if title or insight else "finding"
 
-    # Merge insight sources: insight > atomic_insight > summary
-    insight = data.get("insight") or data.get("atomic_insight") or data.get("summary") or ""
+    entry_id = data.get("id") or new_entry_id(entry_type)
 
     # Merge keyword sources: keywords > tags + key_concepts
     keywords = data.get("keywords")
     if not keywords:
         tags = data.get("tags", [])
         concepts = data.get("key_concepts", [])
-        keywords = list(dict.fromkeys(tags + concepts))  # Dedupe, preserve order
+        # Dedupe, preserve order, and stop once the 10 kept keywords are found
+        keywords = []
+        seen = set()
+        for keyword in chain(tags, concepts):
+            if keyword not in seen:
+                seen.add(keyword)
+                keywords.append(keyword)
+                if len(keywords) == 10:
+                    break
 
     # Merge source: source > url > source_path
     source = data.get("source", "")
     if not source or source in ("manual", "conversation", "review"):
-        source = (
-            data.get("url")
-            or data.get("source_path")
-            or f"conv:{datetime.now().strftime('%Y-%m-%d')}"
-        )
+        source = data.get("url") or data.get("source_path") or f"conv:{date_str}"
 
     # V3 Schema output
     entry = {
         "id": entry_id,
-        "title": data.get("title", ""),
+        "title": title,
         "insight": insight,
         "type": entry_type,
         "priority": data.get("priority", "medium"),
         "keywords": keywords[:10],
         "source": source,
-        "date": data.get("date") or datetime.now().strftime("%Y-%m-%d"),
+        "date": data.get("date") or date_str,
     }
 
     # Ensure title exists
-    if not entry["title"] and entry["insight"]:
-        entry["title"] = entry["insight"][:100]
+    if not title and insight:
+        entry["title"] = insight[:100]
 
     return entry
 
@@ -222,47 +255,33 @@ def send_entry_to_server(entry: dict, project_path: str) -> bool:
     Returns:
         True if entry was added via server, False otherwise.
     """
-    import socket
-
-    try:
-        from kb_utils import get_kb_port_file
-    except ImportError:
-        return False
-
-    # Get server port
-    port_file = get_kb_port_file(Path(project_path))
-    if not port_file.exists():
+    # send_command reuses kb_utils' cached port lookup and compact framing
+    result = send_command(project_path, {"cmd": "add", "entry": entry})
+    if result is None:
         debug_log("KB server not running (no port file)")
         return False
 
-    try:
-        port = int(port_file.read_text().strip())
-    except (ValueError, OSError):
-        debug_log("Invalid port file")
-        return False
+    if result.get("status") == "ok":
+        debug_log(f"Entry added via server: {result.get('id')}")
+        return True
+    debug_log(f"Server rejected entry: {result.get('error')}")
+    return False
 
-    # Send to server
+
+def append_line(path, line):
+    """Append one line to a file with a single unbuffered O_APPEND write.
+
+    Skips the buffered file object entirely, and a single write() call keeps
+    the line from interleaving with concurrent appenders.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5.0)
-        sock.connect(("127.0.0.1", port))
-        sock.sendall(json.dumps({"cmd": "add", "entry": entry}).encode("utf-8"))
-        response = sock.recv(65536).decode("utf-8")
-        sock.close()
-
-        result = json.loads(response)
-        if result.get("status") == "ok":
-            debug_log(f"Entry added via server: {result.get('id')}")
-            return True
-        else:
-            debug_log(f"Server rejected entry: {result.get('error')}")
-            return False
-    except Exception as e:
-        debug_log(f"Failed to send to server: {e}")
-        return False
+        os.write(fd, (line + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
 
 
-def save_entry(entry, knowledge_dir):
+def save_entry(entry, init):
     """Save entry to knowledge database with proper indexing.
 
     Preferred flow (txtai/Mem0 pattern):
@@ -270,45 +289,103 @@ def save_entry(entry, knowledge_dir):
     2. Fall back to direct KnowledgeDB.add() (new process, writes to file)
     3. Fall back to JSONL-only (searchable after server restart)
     """
-    project_path = str(knowledge_dir.parent)
+    return save_entries([entry], init)
+
+
+def save_entries(entries, init):
+    """Save a batch of entries using the same fallback chain as save_entry.
+
+    The server protocol takes one entry per "add" command (and reads a single
+    4 KB message), so the server path is still one round-trip per entry.
+    Entries the server does not take go to KnowledgeDB.add_many in one batch,
+    or failing that are appended to JSONL with a single write.
+    """
+    project_path = init.project_path
 
     # Method 1: Try server (best - immediate sync)
-    if send_entry_to_server(entry, project_path):
+    pending = [entry for entry in entries if not send_entry_to_server(entry, project_path)]
+    if not pending:
         return True
 
     # Method 2: Direct KnowledgeDB (writes to file, but server has stale index)
     try:
         from knowledge_db import KnowledgeDB
 
-        db = KnowledgeDB(project_path)
-        db.add(entry)
-        debug_log("Entry added via direct KnowledgeDB (server index may be stale)")
+        with KnowledgeDB(project_path) as db:
+            db.add_many(pending)
+        debug_log(
+            f"{len(pending)} entries added via direct KnowledgeDB (server index may be stale)"
+        )
         return True
     except ImportError:
         debug_log("KnowledgeDB not available, falling back to JSONL-only")
     except Exception as e:
-        debug_log(f"KnowledgeDB.add() failed: {e}, falling back to JSONL-only")
+        debug_log(f"KnowledgeDB.add_many() failed: {e}, falling back to JSONL-only")
 
     # Method 3: JSONL-only fallback (searchable after server restart)
-    entries_file = knowledge_dir / "entries.jsonl"
-    with open(entries_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
-    debug_log("Entry appended to JSONL (searchable after server restart)")
+    append_line(init.entries_file, "\n".join(json.dumps(entry) for entry in pending))
+    debug_log(f"{len(pending)} entries appended to JSONL (searchable after server restart)")
 
     return True
 
 
-def log_to_timeline(content, entry_type, knowledge_dir):
-    """Log to timeline for chronological tracking."""
-    timeline_file = knowledge_dir / "timeline.txt"
-    timestamp = datetime.now().strftime("%m-%d %H:%M")
+def format_timeline_line(content, entry_type, now=None):
+    """Format one timeline line: "MM-DD HH:MM | type | content"."""
+    timestamp = (now or datetime.now()).strftime("%m-%d %H:%M")
 
     # Truncate content for timeline
     short_content = content[:80].replace("\n", " ")
-    timeline_entry = f"{timestamp} | {entry_type} | {short_content}"
+    return f"{timestamp} | {entry_type} | {short_content}"
+
+
+def log_to_timeline(content, entry_type, timeline_file, now=None):
+    """Log to timeline for chronological tracking."""
+    append_line(timeline_file, format_timeline_line(content, entry_type, now))
+
+
+def capture_batch(items, init, as_json=False, now=None):
+    """Capture a JSON array of entries in one process.
 
-    with open(timeline_file, "a") as f:
-        f.write(timeline_entry + "\n")
+    Saves the whole batch through save_entries and prints one summary, so N
+    entries cost one interpreter start instead of N. Items must be dicts.
+    """
+    if not items:
+        if as_json:
+            print(json.dumps({"status": "success", "count": 0, "ids": []}))
+        else:
+            print("[OK] Nothing to capture (empty array)")
+        return 0
+
+    entries = [create_entry_from_json(data, now=now) for data in items]
+
+    save_entries(entries, init)
+
+    # One timeline write for the whole batch
+    append_line(
+        init.timeline_file,
+        "\n".join(
+            format_timeline_line(entry.get("insight", ""), entry["type"], now) for entry in entries
+        ),
+    )
+
+    if as_json:
+        print(
+            json.dumps(
+                {
+                    "status": "success",
+                    "count": len(entries),
+                    "ids": [entry["id"] for entry in entries],
+                    "path": str(init.entries_file),
+                }
+            )
+        )
+    else:
+        print(f"[OK] Captured {len(entries)} entries")
+        for entry in entries:
+            print(f"  {entry['type']}: {entry['title'][:60]}")
+        print(f"  Saved to: {init.entries_file}")
+
+    return 0
 
 
 def main():
@@ -341,7 +418,9 @@ Examples:
     parser.add_argument("--url", default="", help="Source URL for the entry")
     parser.add_argument("--json", action="store_true", help="Output result as JSON")
     parser.add_argument(
-        "--json-input", dest="json_input", help="Add structured entry from JSON string (V3 schema)"
+        "--json-input",
+        dest="json_input",
+        help="Add structured entry (or JSON array of entries) from JSON string (V3 schema)",
     )
 
     args = parser.parse_args()
@@ -350,9 +429,11 @@ Examples:
     if not args.content and not args.json_input:
         parser.error("Either content or --json-input is required")
 
+    # One clock read shared by the entry id/date and the timeline line
+    now = datetime.now()
+
     try:
         init_result = get_knowledge_dir()
-        knowledge_dir = init_result.path
 
         # Silent init - only mention if both new dir AND server started (and not json mode)
         if init_result.newly_created and init_result.server_started and not args.json:
@@ -364,13 +445,23 @@ Examples:
             try:
                 data = json.loads(args.json_input)
             except json.JSONDecodeError as e:
+                invalid = str(e)
+            else:
+                items = data if isinstance(data, list) else [data]
+                invalid = None
+                if not all(isinstance(item, dict) for item in items):
+                    invalid = "expected an object or an array of objects"
+            if invalid:
                 if args.json:
-                    print(json.dumps({"error": f"Invalid JSON: {e}"}))
+                    print(json.dumps({"error": f"Invalid JSON: {invalid}"}))
                 else:
-                    print(f"[ERROR] Invalid JSON input: {e}", file=sys.stderr)
+                    print(f"[ERROR] Invalid JSON input: {invalid}", file=sys.stderr)
                 return 1
 
-            entry = create_entry_from_json(data)
+            if isinstance(data, list):
+                return capture_batch(data, init_result, args.json, now)
+
+            entry = create_entry_from_json(data, now=now)
             content_display = entry.get("title", "")[:60]
             entry_type = entry.get("type", "lesson")
         else:
@@ -381,15 +472,18 @@ Examples:
                 tags=args.tags,
                 priority=args.priority,
                 url=args.url if args.url else None,
+                now=now,
             )
             content_display = args.content[:60]
             entry_type = args.entry_type
 
         # Save to database
-        save_entry(entry, knowledge_dir)
+        save_entry(entry, init_result)
 
         # Log to timeline
-        log_to_timeline(entry.get("insight", content_display), entry_type, knowledge_dir)
+        log_to_timeline(
+            entry.get("insight", content_display), entry_type, init_result.timeline_file, now=now
+        )
 
         # Output based on mode
         if args.json:
@@ -400,7 +494,7 @@ Examples:
                         "id": entry["id"],
                         "title": entry["title"],
                         "type": entry_type,
-                        "path": str(knowledge_dir / "entries.jsonl"),
+                        "path": str(init_result.entries_file),
                     }
                 )
             )
@@ -408,7 +502,7 @@ Examples:
             print(
                 f"[OK] Captured {entry_type}: {content_display}{'...' if len(content_display) >= 60 else ''}"
             )
-            print(f"  Saved to: {knowledge_dir}/entries.jsonl")
+            print(f"  Saved to: {init_result.entries_file}")
             if entry.get("keywords"):
                 print(f"  Keywords: {', '.join(entry['keywords'])}")
 
@@ -30,6 +30,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from kb_utils import (
+    JSON_SEPARATORS,
     cleanup_stale_files,
     find_project_root,
     get_kb_pid_file,
@@ -40,6 +41,7 @@ from kb_utils import (
     is_process_running,
     kill_process_tree,
     read_pid_file,
+    recv_all,
     write_pid_file,
 )
 
@@ -186,7 +188,7 @@ class KnowledgeServer:
             print(f"Auto-initialized empty Knowledge DB at {db_path}")
 
         print(f"Loading index from {db_path}...")
-        start = time.time()
+        start = time.perf_counter()
 
         # Import KnowledgeDB (fastembed-based)
         sys.path.insert(0, str(Path(__file__).parent))
@@ -196,7 +198,7 @@ class KnowledgeServer:
         self.db = KnowledgeDB(str(self.project_root))
         self.embeddings = self.db  # Alias for compatibility
 
-        self.load_time = time.time() - start
+        self.load_time = time.perf_counter() - start
         count = self.db.count() if hasattr(self.db, "count") else len(self.db._id_to_row)
         print(f"Index loaded in {self.load_time:.2f}s ({count} entries)")
         return True
@@ -216,9 +218,9 @@ class KnowledgeServer:
         if not self.db:
             return {"error": "No index loaded"}
 
-        start = time.time()
+        start = time.perf_counter()
         results = self.db.search(query, limit)
-        search_time = time.time() - start
+        search_time = time.perf_counter() - start
 
         return {"results": results, "search_time_ms": round(search_time * 1000, 2), "query": query}
 
@@ -295,7 +297,7 @@ class KnowledgeServer:
             else:
                 response = {"error": f"Unknown command: {cmd}"}
 
-            conn.sendall(json.dumps(response).encode("utf-8"))
+            conn.sendall(json.dumps(response, separators=JSON_SEPARATORS).encode("utf-8"))
         except Exception as e:
             try:
                 conn.sendall(json.dumps({"error": str(e)}).encode("utf-8"))
@@ -373,6 +375,8 @@ class KnowledgeServer:
 
         # Cleanup
         server.close()
+        if self.db:
+            self.db.close()
         pid_file.unlink(missing_ok=True)
         port_file.unlink(missing_ok=True)
         print("Server stopped")
@@ -393,8 +397,8 @@ def send_command_to_port(port: int, cmd_data: dict, timeout: float = 5.0) -> dic
         client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         client.settimeout(timeout)
         client.connect((HOST, port))
-        client.sendall(json.dumps(cmd_data).encode("utf-8"))
-        response = client.recv(65536).decode("utf-8")
+        client.sendall(json.dumps(cmd_data, separators=JSON_SEPARATORS).encode("utf-8"))
+        response = recv_all(client)
         client.close()
         return json.loads(response)
     except Exception as e:
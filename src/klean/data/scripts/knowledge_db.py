@@ -35,15 +35,42 @@ Usage:
     results = db.search("power optimization", rerank=False)
 """
 
+import atexit
+import copy
+import io
 import json
+import os
 import sys
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 
 import numpy as np
 
+# Parse index files and entries.jsonl with orjson when it is installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+def _parse_line(line: str) -> Any:
+    """Parse one entries.jsonl line, falling back to the stdlib parser.
+
+    json.dumps writes NaN/Infinity and lone-surrogate escapes, which orjson
+    rejects; retrying with json.loads keeps such entries instead of dropping them.
+    """
+    try:
+        return json_loads(line)
+    except json.JSONDecodeError:
+        return json.loads(line)
+
+
 # Import shared utilities
 try:
     from kb_utils import debug_log, find_project_root, migrate_entry
@@ -58,6 +85,30 @@ except ImportError:
     print("ERROR: fastembed not installed. Run: pip install fastembed")
     sys.exit(1)
 
+# Map embeddings.npy read-only instead of reading it into memory. Windows
+# cannot replace a file while it is mapped, so it keeps the eager load.
+EMBEDDINGS_MMAP_MODE = None if sys.platform == "win32" else "r"
+
+
+def _embedding_threads() -> Optional[int]:
+    """Parse KLEAN_EMB_THREADS; None (fastembed's default) unless a positive int."""
+    value = os.environ.get("KLEAN_EMB_THREADS")
+    if not value:
+        return None
+    try:
+        threads = int(value)
+    except ValueError:
+        threads = 0
+    if threads < 1:
+        debug_log(f"Ignoring KLEAN_EMB_THREADS={value!r}: expected a positive integer")
+        return None
+    return threads
+
+
+# ONNX Runtime intra-op threads per model. None keeps fastembed's default,
+# which already uses one thread per physical core.
+EMBEDDING_THREADS = _embedding_threads()
+
 # Optional sparse/rerank imports (lazy loaded)
 SparseTextEmbedding = None
 TextCrossEncoder = None
@@ -74,7 +125,7 @@ def get_dense_model() -> TextEmbedding:
     global _dense_model
     if _dense_model is None:
         # BGE-small: 384 dimensions, good balance of speed and quality
-        _dense_model = TextEmbedding("BAAI/bge-small-en-v1.5")
+        _dense_model = TextEmbedding("BAAI/bge-small-en-v1.5", threads=EMBEDDING_THREADS)
     return _dense_model
 
 
@@ -96,7 +147,9 @@ def get_sparse_model():
                 debug_log("SparseTextEmbedding not available, falling back to dense-only")
                 return None
         # BM42: learned attention weights (90MB) - better than flat BM25
-        _sparse_model = SparseTextEmbedding("Qdrant/bm42-all-minilm-l6-v2-attentions")
+        _sparse_model = SparseTextEmbedding(
+            "Qdrant/bm42-all-minilm-l6-v2-attentions", threads=EMBEDDING_THREADS
+        )
     return _sparse_model
 
 
@@ -112,7 +165,7 @@ def get_reranker():
             except ImportError:
                 debug_log("Cross-encoder reranker not available")
                 return None
-        _reranker = TextCrossEncoder("Xenova/ms-marco-MiniLM-L-6-v2")
+        _reranker = TextCrossEncoder("Xenova/ms-marco-MiniLM-L-6-v2", threads=EMBEDDING_THREADS)
     return _reranker
 
 
@@ -141,6 +194,12 @@ class KnowledgeDB:
     # RRF constant (standard value from literature)
     RRF_K = 60
 
+    # Recent search results kept per (query, limit, rerank)
+    QUERY_CACHE_SIZE = 128
+
+    # Upper bound in seconds on how long stats() reuses the on-disk size
+    STATS_SIZE_TTL = 5.0
+
     def __init__(self, project_path: str = None):
         """
         Initialize KnowledgeDB.
@@ -164,6 +223,7 @@ class KnowledgeDB:
         self.sparse_index_path = self.db_path / "sparse_index.json"
         self.index_path = self.db_path / "index.json"
         self.jsonl_path = self.db_path / "entries.jsonl"
+        self.timeline_path = self.db_path / "timeline.txt"
         self.old_txtai_path = self.db_path / "index"  # Old txtai SQLite
 
         # Create directory if needed
@@ -174,15 +234,36 @@ class KnowledgeDB:
         self._sparse_model = None  # Loaded lazily
         self._reranker = None  # Loaded lazily
 
-        # In-memory index (dense)
+        # In-memory index (dense). After add(), _embeddings is a view of the
+        # live rows of _embedding_buffer, which grows geometrically.
         self._embeddings: Optional[np.ndarray] = None
+        self._embedding_buffer: Optional[np.ndarray] = None
+        # Leading rows of _embeddings already in embeddings.npy (None: unknown)
+        self._saved_rows: Optional[int] = None
         self._id_to_row: dict[str, int] = {}
         self._row_to_id: dict[int, str] = {}
         self._entries: list[dict[str, Any]] = []  # Cached entries
+        self._entries_by_id: dict[str, dict[str, Any]] = {}  # Same dicts, keyed by id
 
         # In-memory sparse index: {row_idx: {token: weight, ...}}
         self._sparse_vectors: dict[int, dict[str, float]] = {}
 
+        # LRU of search results; cleared whenever entries or the index change.
+        # The knowledge server searches from one thread per client, so the
+        # cache is only touched under the lock, and results computed before
+        # an invalidation (older generation) are not stored.
+        self._query_cache: OrderedDict[tuple[str, int, bool], list[dict[str, Any]]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_generation = 0
+
+        # (data file signature, monotonic time, size_bytes) of the last
+        # db_path walk in stats()
+        self._size_cache: Optional[tuple[tuple, float, int]] = None
+
+        # Append handle for entries.jsonl, opened on first add and kept open.
+        # It is in append mode, so rewrites of the file elsewhere stay safe.
+        self._jsonl_writer: Optional[TextIO] = None
+
         # Load existing index if present
         self._load_index()
 
@@ -230,16 +311,20 @@ class KnowledgeDB:
         """Load embeddings, sparse vectors, index, and entries from disk."""
         if self.embeddings_path.exists() and self.index_path.exists():
             try:
-                self._embeddings = np.load(str(self.embeddings_path))
+                # Rows are paged in on demand; add() copies them into its
+                # in-memory buffer before the first write.
+                self._embeddings = np.load(
+                    str(self.embeddings_path), mmap_mode=EMBEDDINGS_MMAP_MODE
+                )
                 with open(self.index_path) as f:
-                    self._id_to_row = json.load(f)
+                    self._id_to_row = json_loads(f.read())
                 self._row_to_id = {v: k for k, v in self._id_to_row.items()}
 
                 # Load sparse vectors if present
                 self._sparse_vectors = {}
                 if self.sparse_index_path.exists():
                     with open(self.sparse_index_path) as f:
-                        sparse_data = json.load(f)
+                        sparse_data = json_loads(f.read())
                         # Convert string keys back to int
                         self._sparse_vectors = {int(k): v for k, v in sparse_data.items()}
                     debug_log(f"Loaded {len(self._sparse_vectors)} sparse vectors")
@@ -251,11 +336,12 @@ class KnowledgeDB:
                         for line in f:
                             if line.strip():
                                 try:
-                                    e = json.loads(line)
+                                    e = _parse_line(line)
                                     if isinstance(e, dict):
                                         self._entries.append(migrate_entry(e))
                                 except json.JSONDecodeError:
                                     pass
+                self._index_entries_by_id()
 
                 # Validate consistency
                 if len(self._embeddings) != len(self._entries):
@@ -263,19 +349,37 @@ class KnowledgeDB:
                         f"WARNING: Index/entries mismatch ({len(self._embeddings)} vs {len(self._entries)})"
                     )
 
+                self._saved_rows = len(self._embeddings)
                 debug_log(f"Loaded {len(self._id_to_row)} embeddings from disk")
             except Exception as e:
                 debug_log(f"Failed to load index: {e}")
                 self._embeddings = None
+                self._saved_rows = None
                 self._id_to_row = {}
                 self._row_to_id = {}
                 self._entries = []
+                self._entries_by_id = {}
                 self._sparse_vectors = {}
 
+    def _index_entries_by_id(self) -> None:
+        """Map ids to cached entries; the first entry with an id wins, as in a file scan."""
+        self._entries_by_id = {}
+        for entry in self._entries:
+            entry_id = entry.get("id")
+            if entry_id and entry_id not in self._entries_by_id:
+                self._entries_by_id[entry_id] = entry
+
     def _save_index(self) -> None:
         """Save embeddings, sparse vectors, and index to disk."""
         if self._embeddings is not None:
-            np.save(str(self.embeddings_path), self._embeddings)
+            if not self._append_saved_embeddings():
+                # Write a new file and swap it in: truncating the existing one
+                # in place would break any process that has it memory-mapped
+                tmp_path = self.embeddings_path.with_name(self.embeddings_path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    np.save(f, self._embeddings)
+                os.replace(tmp_path, self.embeddings_path)
+            self._saved_rows = len(self._embeddings)
             with open(self.index_path, "w") as f:
                 json.dump(self._id_to_row, f)
 
@@ -289,23 +393,122 @@ class KnowledgeDB:
 
             debug_log(f"Saved {len(self._id_to_row)} embeddings to disk")
 
+    def _append_saved_embeddings(self) -> bool:
+        """Write rows added since the last save to the end of embeddings.npy.
+
+        np.save pads the .npy header so the row count can grow in place;
+        existing rows are never touched, so readers mapping the file are
+        unaffected. Returns False when the file does not hold exactly the
+        saved rows, and the caller rewrites it instead.
+        """
+        rows = self._saved_rows
+        if not rows or rows > len(self._embeddings):
+            return False
+
+        fmt = np.lib.format
+        try:
+            with open(self.embeddings_path, "r+b") as f:
+                if fmt.read_magic(f) != (1, 0):
+                    return False
+                shape, fortran_order, dtype = fmt.read_array_header_1_0(f)
+                if (
+                    fortran_order
+                    or dtype != self._embeddings.dtype
+                    or shape != (rows, *self._embeddings.shape[1:])
+                ):
+                    return False
+                data_offset = f.tell()
+
+                header = io.BytesIO()
+                fmt.write_array_header_1_0(
+                    header,
+                    {
+                        "descr": fmt.dtype_to_descr(dtype),
+                        "fortran_order": False,
+                        "shape": self._embeddings.shape,
+                    },
+                )
+                if header.tell() != data_offset:
+                    return False
+
+                # Rows first, then the header that makes them visible
+                new_rows = np.ascontiguousarray(self._embeddings[rows:])
+                f.seek(data_offset + rows * new_rows[:1].nbytes)
+                f.write(new_rows.tobytes())
+                f.flush()
+                f.seek(0)
+                f.write(header.getvalue())
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def _append_embedding(self, embedding: np.ndarray) -> None:
+        """Append one dense vector to the in-memory index.
+
+        Rows live in a buffer with spare capacity that doubles when full, so
+        an append is amortized O(1) instead of copying the whole matrix the
+        way np.vstack does. _embeddings stays a view of the filled rows.
+        """
+        rows = 0 if self._embeddings is None else len(self._embeddings)
+        buffer = self._embedding_buffer
+
+        # Reallocate when full, or when _embeddings was replaced by a load/rebuild
+        if (
+            buffer is None
+            or self._embeddings is None
+            or self._embeddings.base is not buffer
+            or rows == len(buffer)
+        ):
+            dtype = embedding.dtype
+            if self._embeddings is not None:
+                dtype = np.result_type(self._embeddings, embedding)
+            buffer = np.empty((max(16, 2 * rows), embedding.shape[-1]), dtype=dtype)
+            if rows:
+                buffer[:rows] = self._embeddings
+            self._embedding_buffer = buffer
+
+        buffer[rows] = embedding
+        self._embeddings = buffer[: rows + 1]
+
+    def _rows_by_searchable_text(self) -> dict[str, int]:
+        """Map searchable text to its row in the loaded index.
+
+        Only trusted when every indexed row holds the entry its ID maps to;
+        a reordered index yields an empty map. Entries appended to the JSONL
+        after the last indexed row (JSONL-only captures) have no row yet.
+        """
+        if self._embeddings is None or len(self._embeddings) != len(self._id_to_row):
+            return {}
+
+        rows = {}
+        for row_idx, entry in enumerate(self._entries[: len(self._embeddings)]):
+            if self._id_to_row.get(entry.get("id")) != row_idx:
+                return {}
+            rows[self._build_searchable_text(entry)] = row_idx
+        return rows
+
     def _build_searchable_text(self, entry: dict[str, Any]) -> str:
         """Build searchable text from entry fields.
 
         V3 Schema uses: title, insight, keywords
         Also includes legacy fields for backward compatibility.
         """
-        searchable_parts = [
+        # Only join the list fields an entry actually has; filter() then drops
+        # missing and empty parts in C
+        keywords = entry.get("keywords")
+        key_concepts = entry.get("key_concepts")
+        tags = entry.get("tags")
+        searchable_parts = (
             # V3 primary fields
-            entry.get("title", ""),
-            entry.get("insight", ""),
-            " ".join(entry.get("keywords", [])),
+            entry.get("title"),
+            entry.get("insight"),
+            keywords and " ".join(keywords),
             # Legacy fields (for backward compatibility with old entries)
-            entry.get("summary", ""),
-            entry.get("atomic_insight", ""),
-            " ".join(entry.get("key_concepts", [])),
-            " ".join(entry.get("tags", [])),
-        ]
+            entry.get("summary"),
+            entry.get("atomic_insight"),
+            key_concepts and " ".join(key_concepts),
+            tags and " ".join(tags),
+        )
         return " ".join(filter(None, searchable_parts))
 
     @staticmethod
@@ -337,11 +540,10 @@ class KnowledgeDB:
 
         try:
             # BM42 returns sparse embedding with indices and values
-            embeddings = list(self.sparse_model.embed([text]))
-            if not embeddings:
+            sparse_emb = next(iter(self.sparse_model.embed([text])), None)
+            if sparse_emb is None:
                 return {}
 
-            sparse_emb = embeddings[0]
             # Convert to {token: weight} dict (keeping top weights)
             # sparse_emb has .indices and .values attributes
             result = {}
@@ -353,6 +555,22 @@ class KnowledgeDB:
             debug_log(f"Sparse embedding failed: {e}")
             return {}
 
+    def _embed_one(self, text: str) -> np.ndarray:
+        """Dense embedding of a single text, taken straight off the model's generator."""
+        return next(iter(self.dense_model.embed([text])))
+
+    def _embed_many(self, texts: list[str]) -> list[np.ndarray]:
+        """Dense embeddings of texts, in input order.
+
+        The model pads each batch to its longest text, so texts are fed
+        shortest first to keep similar lengths together.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embeddings: list[Optional[np.ndarray]] = [None] * len(texts)
+        for i, embedding in zip(order, self.dense_model.embed([texts[i] for i in order])):
+            embeddings[i] = embedding
+        return embeddings
+
     def _dense_search(self, query: str, limit: int) -> list[tuple]:
         """
         Dense (semantic) search using cosine similarity.
@@ -367,14 +585,21 @@ class KnowledgeDB:
         if self._embeddings is None or len(self._embeddings) == 0:
             return []
 
-        # Generate query embedding
-        query_embedding = list(self.dense_model.embed([query]))[0]
+        # Generate query embedding, matching the matrix dtype: a mixed-dtype
+        # product would upcast a copy of the whole matrix on every query
+        query_embedding = np.ascontiguousarray(self._embed_one(query), dtype=self._embeddings.dtype)
 
-        # Compute cosine similarity (embeddings are normalized)
+        # Compute cosine similarity (embeddings are normalized). The matrix is
+        # C-contiguous (loaded, rebuilt or a row slice of the add buffer), so
+        # this is a single BLAS gemv.
         scores = self._embeddings @ query_embedding
 
-        # Get top-k indices
-        top_indices = np.argsort(scores)[::-1][:limit]
+        # Get top-k indices: partition out the k best in O(N), then sort only those
+        k = min(limit, len(scores))
+        if k <= 0:
+            return []
+        top_k = np.argpartition(scores, -k)[-k:]
+        top_indices = top_k[np.argsort(scores[top_k])[::-1]]
 
         return [(int(idx), float(scores[idx])) for idx in top_indices]
 
@@ -468,78 +693,130 @@ class KnowledgeDB:
         Returns:
             Entry ID (UUID) - either new or existing if duplicate detected
         """
+        return self.add_many([entry], check_duplicates=check_duplicates)[0]
+
+    def add_many(self, entries: list[dict[str, Any]], check_duplicates: bool = True) -> list[str]:
+        """
+        Add several entries, embedding them in one batch and saving once.
+
+        Entries are validated, deduplicated and normalized as in add(). New
+        entries are embedded in a single model call, the index is written once
+        and their JSONL lines are appended in one write. Duplicates are checked
+        against entries already in the index, not against the rest of the batch.
+
+        Args:
+            entries: Entry dictionaries (see add() for fields)
+            check_duplicates: If True, return the existing ID for near-duplicates
+
+        Returns:
+            Entry IDs in input order (existing ID where a duplicate was detected)
+        """
         # Ensure required fields first (accept both V3 'insight' and V2 'summary')
-        if "title" not in entry:
-            raise ValueError("Entry must have 'title' field")
-        if "insight" not in entry and "summary" not in entry:
-            raise ValueError("Entry must have 'insight' field (or 'summary' for V2 compat)")
-
-        # Semantic deduplication check (research-backed, threshold 0.85)
-        if check_duplicates and self._entries:
-            query = f"{entry.get('title', '')} {entry.get('insight', entry.get('summary', ''))}"
-            try:
-                # Fast search without reranking for dedup check
-                similar = self.search(query, limit=1, rerank=False)
-                if similar and similar[0].get("score", 0) > 0.85:
-                    existing_id = similar[0].get("id")
-                    existing_title = similar[0].get("title", "")[:50]
-                    debug_log(
-                        f"Duplicate detected (score={similar[0]['score']:.2f}): '{existing_title}'"
-                    )
-                    return existing_id  # Return existing ID instead of adding duplicate
-            except Exception as e:
-                debug_log(f"Dedup check failed (proceeding with add): {e}")
+        for entry in entries:
+            if "title" not in entry:
+                raise ValueError("Entry must have 'title' field")
+            if "insight" not in entry and "summary" not in entry:
+                raise ValueError("Entry must have 'insight' field (or 'summary' for V2 compat)")
+
+        entry_ids = []
+        new_entries = []
+        for entry in entries:
+            # Semantic deduplication check (research-backed, threshold 0.85)
+            if check_duplicates and self._entries:
+                query = f"{entry.get('title', '')} {entry.get('insight', entry.get('summary', ''))}"
+                try:
+                    # Fast search without reranking for dedup check
+                    similar = self.search(query, limit=1, rerank=False)
+                    if similar and similar[0].get("score", 0) > 0.85:
+                        existing_id = similar[0].get("id")
+                        existing_title = similar[0].get("title", "")[:50]
+                        debug_log(
+                            f"Duplicate detected (score={similar[0]['score']:.2f}): "
+                            f"'{existing_title}'"
+                        )
+                        # Return existing ID instead of adding duplicate
+                        entry_ids.append(existing_id)
+                        continue
+                except Exception as e:
+                    debug_log(f"Dedup check failed (proceeding with add): {e}")
 
-        # Generate ID if not provided
-        entry_id = entry.get("id") or str(uuid.uuid4())
-        entry["id"] = entry_id
+            # Generate ID if not provided
+            entry_id = entry.get("id") or str(uuid.uuid4())
+            entry["id"] = entry_id
 
-        # Add timestamp (V3 uses 'date', V2 used 'found_date')
-        if "date" not in entry:
-            entry["date"] = entry.get("found_date", "")[:10] or datetime.now().strftime("%Y-%m-%d")
+            # Add timestamp (V3 uses 'date', V2 used 'found_date')
+            if "date" not in entry:
+                entry["date"] = entry.get("found_date", "")[:10] or datetime.now().strftime(
+                    "%Y-%m-%d"
+                )
 
-        # Normalize V2 to V3 if needed
-        if "insight" not in entry and "summary" in entry:
-            entry["insight"] = entry["summary"]
-        if "keywords" not in entry and "tags" in entry:
-            entry["keywords"] = entry["tags"]
+            # Normalize V2 to V3 if needed
+            if "insight" not in entry and "summary" in entry:
+                entry["insight"] = entry["summary"]
+            if "keywords" not in entry and "tags" in entry:
+                entry["keywords"] = entry["tags"]
 
-        # V3 defaults
-        entry.setdefault("type", "finding")
-        entry.setdefault("priority", "medium")
-        entry.setdefault("keywords", [])
-        entry.setdefault("source", f"conv:{entry['date']}")
+            # V3 defaults
+            entry.setdefault("type", "finding")
+            entry.setdefault("priority", "medium")
+            entry.setdefault("keywords", [])
+            entry.setdefault("source", f"conv:{entry['date']}")
 
-        # Build searchable text
-        searchable_text = self._build_searchable_text(entry)
+            entry_ids.append(entry_id)
+            new_entries.append(entry)
 
-        # Generate dense embedding
-        embedding = list(self.dense_model.embed([searchable_text]))[0]
+        if not new_entries:
+            return entry_ids
 
-        # Add to in-memory dense index
-        if self._embeddings is None:
-            self._embeddings = embedding.reshape(1, -1)
-        else:
-            self._embeddings = np.vstack([self._embeddings, embedding])
+        # Build searchable texts
+        searchable_texts = [self._build_searchable_text(entry) for entry in new_entries]
 
-        row_idx = len(self._id_to_row)
-        self._id_to_row[entry_id] = row_idx
-        self._row_to_id[row_idx] = entry_id
-        self._entries.append(entry)  # Add to cache
+        # Generate dense embeddings in one batch
+        embeddings = self._embed_many(searchable_texts)
 
-        # Generate sparse embedding (if model available)
-        sparse_vec = self._generate_sparse_embedding(searchable_text)
-        if sparse_vec:
-            self._sparse_vectors[row_idx] = sparse_vec
+        for entry, searchable_text, embedding in zip(new_entries, searchable_texts, embeddings):
+            # Add to in-memory dense index
+            self._append_embedding(embedding)
 
-        # Save to disk
+            row_idx = len(self._id_to_row)
+            self._id_to_row[entry["id"]] = row_idx
+            self._row_to_id[row_idx] = entry["id"]
+            self._entries.append(entry)  # Add to cache
+            self._entries_by_id.setdefault(entry["id"], entry)
+
+            # Generate sparse embedding (if model available)
+            sparse_vec = self._generate_sparse_embedding(searchable_text)
+            if sparse_vec:
+                self._sparse_vectors[row_idx] = sparse_vec
+
+        # Save to disk once for the whole batch
+        self._invalidate_query_cache()
         self._save_index()
 
         # Append to JSONL backup
-        with open(self.jsonl_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._append_jsonl(new_entries)
+
+        return entry_ids
+
+    def _append_jsonl(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries to entries.jsonl through the long-lived handle."""
+        if self._jsonl_writer is None:
+            self._jsonl_writer = open(self.jsonl_path, "a")
+        self._jsonl_writer.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        # Flush per batch so other readers only ever see complete lines
+        self._jsonl_writer.flush()
+
+    def close(self) -> None:
+        """Close the entries.jsonl append handle; the next add reopens it."""
+        if self._jsonl_writer is not None:
+            self._jsonl_writer.close()
+            self._jsonl_writer = None
 
-        return entry_id
+    def __enter__(self) -> "KnowledgeDB":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def search(
         self,
@@ -567,6 +844,15 @@ class KnowledgeDB:
         if self._embeddings is None or len(self._embeddings) == 0:
             return []
 
+        # Repeated queries skip embedding, retrieval and reranking entirely
+        cache_key = (query, limit, rerank)
+        with self._query_cache_lock:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+            generation = self._query_generation
+
         # Get more candidates for fusion (2x limit)
         candidate_limit = limit * 2
 
@@ -616,7 +902,20 @@ class KnowledgeDB:
         else:
             results = results[:limit]
 
-        return results
+        with self._query_cache_lock:
+            if generation == self._query_generation:
+                self._query_cache[cache_key] = results
+                if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+
+        # Results share nested lists with self._entries and the cache
+        return copy.deepcopy(results)
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached search results; call after entries or the index change."""
+        with self._query_cache_lock:
+            self._query_generation += 1
+            self._query_cache.clear()
 
     def get(self, entry_id: str) -> Optional[dict[str, Any]]:
         """
@@ -628,6 +927,11 @@ class KnowledgeDB:
         Returns:
             Entry dictionary or None if not found
         """
+        entry = self._entries_by_id.get(entry_id)
+        if entry is not None:
+            return copy.deepcopy(entry)
+
+        # Not indexed yet (e.g. appended to the JSONL by another process)
         if not self.jsonl_path.exists():
             return None
 
@@ -635,13 +939,24 @@ class KnowledgeDB:
             for line in f:
                 if line.strip():
                     try:
-                        entry = json.loads(line)
+                        entry = _parse_line(line)
                         if isinstance(entry, dict) and entry.get("id") == entry_id:
                             return migrate_entry(entry)
                     except json.JSONDecodeError:
                         pass
         return None
 
+    def _data_files_signature(self) -> tuple:
+        """(mtime_ns, size) of the files KB writes touch, None if missing."""
+        signature = []
+        for path in (self.jsonl_path, self.embeddings_path, self.timeline_path):
+            try:
+                st = path.stat()
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
     def stats(self) -> dict[str, Any]:
         """
         Get database statistics.
@@ -650,13 +965,25 @@ class KnowledgeDB:
             Dictionary with count, size, last_updated
         """
         count = len(self._id_to_row) if self._id_to_row else 0
-        size_bytes = 0
         last_updated = None
 
-        # Get size
-        for f in self.db_path.rglob("*"):
-            if f.is_file():
-                size_bytes += f.stat().st_size
+        # Get size. Walking the tree stats every file, so reuse the last total
+        # while entries.jsonl, embeddings.npy and timeline.txt are unchanged,
+        # for at most STATS_SIZE_TTL seconds to pick up any other files.
+        signature = self._data_files_signature()
+        now = time.monotonic()
+        if (
+            self._size_cache is not None
+            and self._size_cache[0] == signature
+            and now - self._size_cache[1] < self.STATS_SIZE_TTL
+        ):
+            size_bytes = self._size_cache[2]
+        else:
+            size_bytes = 0
+            for f in self.db_path.rglob("*"):
+                if f.is_file():
+                    size_bytes += f.stat().st_size
+            self._size_cache = (signature, now, size_bytes)
 
         # Last modified
         if self.embeddings_path.exists():
@@ -673,7 +1000,9 @@ class KnowledgeDB:
             "sparse_entries": len(self._sparse_vectors),
         }
 
-    def rebuild_index(self, dense_only: bool = False, batch_size: int = 50) -> int:
+    def rebuild_index(
+        self, dense_only: bool = False, batch_size: int = 50, reuse_embeddings: bool = True
+    ) -> int:
         """
         Rebuild the index from JSONL backup.
         Migrates from txtai format or rebuilds fastembed index.
@@ -681,6 +1010,8 @@ class KnowledgeDB:
         Args:
             dense_only: If True, skip sparse embeddings (faster, less memory)
             batch_size: Batch size for sparse embedding generation (memory control)
+            reuse_embeddings: If True, keep vectors from the loaded index for
+                entries whose searchable text is unchanged
 
         Returns:
             Number of entries indexed
@@ -695,7 +1026,7 @@ class KnowledgeDB:
             for line in f:
                 if line.strip():
                     try:
-                        entry = json.loads(line)
+                        entry = _parse_line(line)
                         if isinstance(entry, dict):
                             entry = migrate_entry(entry)
                             # Ensure every entry has an ID
@@ -719,29 +1050,64 @@ class KnowledgeDB:
         # Build searchable texts
         texts = [self._build_searchable_text(e) for e in entries]
 
-        # Generate dense embeddings in batch
-        debug_log(f"Generating dense embeddings for {len(texts)} entries...")
-        embeddings_list = list(self.dense_model.embed(texts))
-        self._embeddings = np.array(embeddings_list)
+        # Rows of the loaded index that can be reused, by new row index
+        reused_rows = {}
+        if reuse_embeddings:
+            loaded_rows = self._rows_by_searchable_text()
+            for idx, text in enumerate(texts):
+                if text in loaded_rows:
+                    reused_rows[idx] = loaded_rows[text]
+
+        # Generate dense embeddings in batch (only for new or changed texts)
+        embed_indices = [idx for idx in range(len(texts)) if idx not in reused_rows]
+        debug_log(
+            f"Generating dense embeddings for {len(embed_indices)} entries "
+            f"({len(reused_rows)} reused)..."
+        )
+        fresh = []
+        if embed_indices:
+            fresh = self._embed_many([texts[idx] for idx in embed_indices])
+
+        # Fill one preallocated matrix rather than stacking a list of rows
+        sources = ([self._embeddings] if reused_rows else []) + fresh[:1]
+        embeddings = np.empty((len(texts), sources[0].shape[-1]), dtype=np.result_type(*sources))
+        for idx, embedding in zip(embed_indices, fresh):
+            embeddings[idx] = embedding
+        if reused_rows:
+            embeddings[list(reused_rows)] = self._embeddings[list(reused_rows.values())]
+        self._embeddings = embeddings
+        # The add() buffer only holds the old rows; free it now instead of
+        # keeping it alive until the next add reallocates
+        self._embedding_buffer = None
+        self._saved_rows = None
 
         # Generate sparse embeddings (if model available and not dense_only)
+        loaded_sparse = self._sparse_vectors
         self._sparse_vectors = {}
         if dense_only:
             debug_log("Skipping sparse embeddings (--dense-only mode)")
         elif self.sparse_model is not None:
+            sparse_indices = []
+            for idx in range(len(texts)):
+                if idx in reused_rows and reused_rows[idx] in loaded_sparse:
+                    self._sparse_vectors[idx] = loaded_sparse[reused_rows[idx]]
+                else:
+                    sparse_indices.append(idx)
+
             debug_log(
-                f"Generating sparse embeddings for {len(texts)} entries (batch_size={batch_size})..."
+                f"Generating sparse embeddings for {len(sparse_indices)} entries "
+                f"(batch_size={batch_size})..."
             )
             try:
                 # Process in batches to avoid memory exhaustion
-                for batch_start in range(0, len(texts), batch_size):
-                    batch_end = min(batch_start + batch_size, len(texts))
-                    batch_texts = texts[batch_start:batch_end]
+                for batch_start in range(0, len(sparse_indices), batch_size):
+                    batch_end = min(batch_start + batch_size, len(sparse_indices))
+                    batch_indices = sparse_indices[batch_start:batch_end]
+                    batch_texts = [texts[idx] for idx in batch_indices]
                     debug_log(f"  Processing batch {batch_start}-{batch_end}...")
 
                     sparse_list = list(self.sparse_model.embed(batch_texts))
-                    for local_idx, sparse_emb in enumerate(sparse_list):
-                        global_idx = batch_start + local_idx
+                    for global_idx, sparse_emb in zip(batch_indices, sparse_list):
                         # Convert to {token: weight} dict
                         vec = {}
                         for token_idx, val in zip(sparse_emb.indices, sparse_emb.values):
@@ -760,10 +1126,12 @@ class KnowledgeDB:
         self._id_to_row = {}
         self._row_to_id = {}
         self._entries = entries  # Cache all entries
+        self._index_entries_by_id()
         for idx, entry in enumerate(entries):
             entry_id = entry["id"]  # Now guaranteed to exist
             self._id_to_row[entry_id] = idx
             self._row_to_id[idx] = entry_id
+        self._invalidate_query_cache()
 
         # Save to disk
         self._save_index()
@@ -794,7 +1162,7 @@ class KnowledgeDB:
                 for line in f:
                     if line.strip():
                         try:
-                            entry = json.loads(line)
+                            entry = _parse_line(line)
                             if isinstance(entry, dict):
                                 entries.append(migrate_entry(entry))
                         except json.JSONDecodeError:
@@ -830,7 +1198,7 @@ class KnowledgeDB:
             for line in f:
                 if line.strip():
                     try:
-                        entry = json.loads(line)
+                        entry = _parse_line(line)
                         if isinstance(entry, dict):
                             if entry.get("id") in id_set:
                                 entry["usage_count"] = entry.get("usage_count", 0) + 1
@@ -846,11 +1214,12 @@ class KnowledgeDB:
                 for entry in entries:
                     f.write(json.dumps(entry) + "\n")
 
-            # Update cached entries too
+            # Update cached entries too (search results embed usage stats)
             for i, entry in enumerate(self._entries):
                 if entry.get("id") in id_set:
                     self._entries[i]["usage_count"] = entry.get("usage_count", 0) + 1
                     self._entries[i]["last_used"] = now
+            self._invalidate_query_cache()
 
         return updated_count
 
@@ -1001,7 +1370,7 @@ class KnowledgeDB:
                 if not line.strip():
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = _parse_line(line)
                     if not isinstance(entry, dict):
                         skipped_lines += 1
                         continue
@@ -1067,6 +1436,9 @@ if __name__ == "__main__":
     parser.add_argument(
         "--batch-size", type=int, default=50, help="Batch size for sparse embeddings"
     )
+    parser.add_argument(
+        "--full", action="store_true", help="Re-embed every entry on rebuild (no vector reuse)"
+    )
     parser.add_argument("--title", "-t", help="Entry title")
     parser.add_argument("--tags", help="Comma-separated tags")
     parser.add_argument("--source", "-s", help="Source identifier")
@@ -1079,6 +1451,7 @@ if __name__ == "__main__":
     except ValueError as e:
         print(f"ERROR: {e}")
         sys.exit(1)
+    atexit.register(db.close)
 
     # Handle --json-input
     if args.json_input:
@@ -1185,7 +1558,9 @@ if __name__ == "__main__":
         batch_size = getattr(args, "batch_size", 50)
         mode = "dense-only" if dense_only else "hybrid (dense+sparse)"
         print(f"Rebuilding index from JSONL backup... (mode: {mode})")
-        count = db.rebuild_index(dense_only=dense_only, batch_size=batch_size)
+        count = db.rebuild_index(
+            dense_only=dense_only, batch_size=batch_size, reuse_embeddings=not args.full
+        )
         backend = "fastembed" if dense_only else "fastembed-hybrid"
         print(f"Rebuilt index with {count} entries (backend: {backend})")
 
@@ -176,6 +176,8 @@ def main():
 
     # Sync
     synced = sync_to_kb(lessons, db, args.dry_run)
+    if db is not None:
+        db.close()
 
     if args.dry_run:
         print(f"\n Would sync {synced} lessons")
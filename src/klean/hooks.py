@@ -331,9 +331,8 @@ def _get_kb_context(project_root: Path) -> str:
     """
     import socket
 
-    if not _is_kb_server_running(project_root):
-        return "[>] Session history: mcp__serena__read_memory lessons-learned"
-
+    # No separate ping: the "recent" request doubles as the liveness check
+    # (a missing port file or refused connect lands in the fallback below)
     try:
         port_file = get_kb_port_file(project_root)
         port = int(port_file.read_text().strip())
@@ -5,6 +5,9 @@ Utilities for model name generation, parsing, and validation.
 
 import re
 
+# Substrings that mark a model as a thinking/reasoning model
+THINKING_KEYWORDS = ("thinking", "reasoning", "reflection", "r1", "deepseek-r1")
+
 
 def extract_model_name(full_model_id: str) -> str:
     """Auto-generate short model name from full model ID.
@@ -85,12 +88,5 @@ def is_thinking_model(model_name: str) -> bool:
     Returns:
         True if model is a thinking model, False otherwise
     """
-    thinking_keywords = [
-        "thinking",
-        "reasoning",
-        "reflection",
-        "r1",
-        "deepseek-r1",
-    ]
     model_lower = model_name.lower()
-    return any(keyword in model_lower for keyword in thinking_keywords)
+    return any(keyword in model_lower for keyword in THINKING_KEYWORDS)
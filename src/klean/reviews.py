@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import re
 import subprocess
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +25,21 @@ import httpx
 # LiteLLM proxy default
 LITELLM_URL = "http://localhost:4000"
 
+# Review prompts (filled with str.format at call time)
+QUICK_REVIEW_PROMPT = """Review this code for: {focus}
+
+CODE:
+{context}
+
+Provide: Grade (A-F), Risk, Issues, Verdict (APPROVE/REQUEST_CHANGES)"""
+
+CONSENSUS_REVIEW_PROMPT = """Review this code for: {focus}
+
+CODE:
+{context}
+
+Provide: Grade (A-F), Risk, Top 3 Issues, Verdict"""
+
 
 @dataclass
 class ReviewResult:
@@ -173,6 +189,8 @@ async def quick_review(
     context: str,
     system_prompt: str = "Concise code reviewer.",
     timeout: float = 60.0,
+    client: httpx.AsyncClient | None = None,
+    check_health: bool = True,
 ) -> ReviewResult:
     """Perform a quick review with a single model.
 
@@ -182,71 +200,88 @@ async def quick_review(
         context: Code context (diff, code snippet, etc.).
         system_prompt: System prompt for the model.
         timeout: Request timeout in seconds.
+        client: Existing async HTTP client to reuse (one is created if omitted).
+        check_health: Probe the model (and fall back) before reviewing. Pass
+            False when the caller has just verified the model is healthy.
 
     Returns:
         ReviewResult with model response.
     """
-    start_time = datetime.now()
-
-    prompt = f"""Review this code for: {focus}
-
-CODE:
-{context}
-
-Provide: Grade (A-F), Risk, Issues, Verdict (APPROVE/REQUEST_CHANGES)"""
-
-    async with httpx.AsyncClient() as client:
-        # Check model health first
-        if not await _check_model_health(client, model):
-            # Try to find a healthy fallback
-            healthy = await _get_healthy_models(client, count=1)
-            if healthy:
-                model = healthy[0]
-            else:
-                return ReviewResult(
-                    model=model,
-                    content="",
-                    success=False,
-                    error="No healthy models available",
-                    duration_ms=0,
-                )
-
-        try:
-            response = await client.post(
-                f"{LITELLM_URL}/chat/completions",
-                json={
-                    "model": model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 10000,
-                },
-                timeout=timeout,
+    if client is None:
+        async with httpx.AsyncClient() as client:
+            return await _quick_review_with_client(
+                client, model, focus, context, system_prompt, timeout, check_health
             )
-            response.raise_for_status()
-            content = _extract_content(response.json())
+    return await _quick_review_with_client(
+        client, model, focus, context, system_prompt, timeout, check_health
+    )
 
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
-            return ReviewResult(
-                model=model,
-                content=content,
-                success=bool(content),
-                error=None if content else "Empty response",
-                duration_ms=duration_ms,
-            )
-        except Exception as e:
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+async def _quick_review_with_client(
+    client: httpx.AsyncClient,
+    model: str,
+    focus: str,
+    context: str,
+    system_prompt: str,
+    timeout: float,
+    check_health: bool,
+) -> ReviewResult:
+    """Run quick_review over an already open client."""
+    start_time = time.perf_counter()
+
+    prompt = QUICK_REVIEW_PROMPT.format(focus=focus, context=context)
+
+    # Check model health first
+    if check_health and not await _check_model_health(client, model):
+        # Try to find a healthy fallback
+        healthy = await _get_healthy_models(client, count=1)
+        if healthy:
+            model = healthy[0]
+        else:
             return ReviewResult(
                 model=model,
                 content="",
                 success=False,
-                error=str(e),
-                duration_ms=duration_ms,
+                error="No healthy models available",
+                duration_ms=0,
             )
 
+    try:
+        response = await client.post(
+            f"{LITELLM_URL}/chat/completions",
+            json={
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                "temperature": 0.3,
+                "max_tokens": 10000,
+            },
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        content = _extract_content(response.json())
+
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
+
+        return ReviewResult(
+            model=model,
+            content=content,
+            success=bool(content),
+            error=None if content else "Empty response",
+            duration_ms=duration_ms,
+        )
+    except Exception as e:
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
+        return ReviewResult(
+            model=model,
+            content="",
+            success=False,
+            error=str(e),
+            duration_ms=duration_ms,
+        )
+
 
 async def consensus_review(
     focus: str,
@@ -267,14 +302,9 @@ async def consensus_review(
     Returns:
         ConsensusResult with all model responses.
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
-    prompt = f"""Review this code for: {focus}
-
-CODE:
-{context}
-
-Provide: Grade (A-F), Risk, Top 3 Issues, Verdict"""
+    prompt = CONSENSUS_REVIEW_PROMPT.format(focus=focus, context=context)
 
     async with httpx.AsyncClient() as client:
         # Get healthy models
@@ -297,7 +327,7 @@ Provide: Grade (A-F), Risk, Top 3 Issues, Verdict"""
 
         # Query all models in parallel
         async def query_model(model: str) -> ReviewResult:
-            model_start = datetime.now()
+            model_start = time.perf_counter()
             try:
                 response = await client.post(
                     f"{LITELLM_URL}/chat/completions",
@@ -314,7 +344,7 @@ Provide: Grade (A-F), Risk, Top 3 Issues, Verdict"""
                 )
                 response.raise_for_status()
                 content = _extract_content(response.json())
-                duration_ms = int((datetime.now() - model_start).total_seconds() * 1000)
+                duration_ms = int((time.perf_counter() - model_start) * 1000)
 
                 return ReviewResult(
                     model=model,
@@ -324,7 +354,7 @@ Provide: Grade (A-F), Risk, Top 3 Issues, Verdict"""
                     duration_ms=duration_ms,
                 )
             except Exception as e:
-                duration_ms = int((datetime.now() - model_start).total_seconds() * 1000)
+                duration_ms = int((time.perf_counter() - model_start) * 1000)
                 return ReviewResult(
                     model=model,
                     content="",
@@ -334,13 +364,14 @@ Provide: Grade (A-F), Risk, Top 3 Issues, Verdict"""
                 )
 
         results = await asyncio.gather(*[query_model(m) for m in healthy_models])
-        total_duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        total_duration_ms = int((time.perf_counter() - start_time) * 1000)
+        successful_count = sum(1 for r in results if r.success)
 
         return ConsensusResult(
             results=list(results),
             total_duration_ms=total_duration_ms,
-            successful_count=sum(1 for r in results if r.success),
-            failed_count=sum(1 for r in results if not r.success),
+            successful_count=successful_count,
+            failed_count=len(results) - successful_count,
         )
 
 
@@ -375,12 +406,15 @@ async def second_opinion(
     async with httpx.AsyncClient() as client:
         for model in models_to_try:
             if await _check_model_health(client, model):
+                # Reuse this client's connection pool for the review itself
                 result = await quick_review(
                     model=model,
                     focus=focus,
                     context=context,
                     system_prompt=system_prompt,
                     timeout=timeout,
+                    client=client,
+                    check_health=False,  # just probed above
                 )
                 if result.success:
                     return result
@@ -400,6 +434,15 @@ async def second_opinion(
 # =============================================================================
 
 
+def _head_lines(text: str, max_lines: int) -> str:
+    """Return the first max_lines lines of text.
+
+    Splits at most max_lines times so the unused tail of a large diff stays
+    one string instead of being broken into a list that is thrown away.
+    """
+    return "\n".join(text.split("\n", max_lines)[:max_lines])
+
+
 def get_git_diff(work_dir: Path | None = None, max_lines: int = 300) -> str:
     """Get git diff for review context.
 
@@ -422,8 +465,7 @@ def get_git_diff(work_dir: Path | None = None, max_lines: int = 300) -> str:
             timeout=10,
         )
         if result.returncode == 0 and result.stdout.strip():
-            lines = result.stdout.strip().split("\n")
-            return "\n".join(lines[:max_lines])
+            return _head_lines(result.stdout.strip(), max_lines)
     except Exception:
         pass
 
@@ -437,8 +479,7 @@ def get_git_diff(work_dir: Path | None = None, max_lines: int = 300) -> str:
             timeout=10,
         )
         if result.returncode == 0 and result.stdout.strip():
-            lines = result.stdout.strip().split("\n")
-            return "\n".join(lines[:max_lines])
+            return _head_lines(result.stdout.strip(), max_lines)
     except Exception:
         pass
 
@@ -11,6 +11,7 @@ know about:
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -195,24 +196,30 @@ def gather_project_context(start_path: Path = None) -> ProjectContext:
     # Detect project root
     project_root = detect_project_root(start_path)
 
-    # Get git info
-    git_info = get_git_info(project_root)
+    # Git subprocesses and the MCP config parse are independent of each
+    # other and of the local file checks below, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        git_future = pool.submit(get_git_info, project_root)
+        serena_future = pool.submit(check_serena_available)
 
-    # Find knowledge DB
-    kb_path = find_knowledge_db(project_root)
+        # Find knowledge DB
+        kb_path = find_knowledge_db(project_root)
 
-    # Check Serena
-    serena_available = check_serena_available()
+        # Load project instructions
+        claude_md = load_claude_md(project_root)
 
-    # Scripts dir
-    scripts_dir = Path.home() / ".claude" / "scripts"
-    if not scripts_dir.exists():
-        scripts_dir = None
+        # Scripts dir
+        scripts_dir = Path.home() / ".claude" / "scripts"
+        if not scripts_dir.exists():
+            scripts_dir = None
+
+        git_info = git_future.result()
+        serena_available = serena_future.result()
 
     return ProjectContext(
         project_root=project_root,
         project_name=project_root.name,
-        claude_md=load_claude_md(project_root),
+        claude_md=claude_md,
         knowledge_db_path=kb_path,
         has_knowledge_db=kb_path is not None,
         serena_available=serena_available,
@@ -6,6 +6,7 @@ Primary agent execution engine for K-LEAN.
 import tempfile
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +29,17 @@ from .tools import (
 )
 
 
+@lru_cache(maxsize=1)
+def _get_system_prompt_template():
+    """Compile the K-LEAN system prompt template once per process.
+
+    Only the render step depends on the agent (tools, instructions).
+    """
+    from jinja2 import Template
+
+    return Template(KLEAN_SYSTEM_PROMPT)
+
+
 def add_step_awareness(memory_step, agent) -> None:
     """Inject step awareness into observations on late steps.
 
@@ -290,10 +302,7 @@ class SmolKLNExecutor:
 
         # REPLACE default system prompt to remove John Doe/Ulam examples
         # KLEAN_SYSTEM_PROMPT uses Jinja2 placeholders for tools/managed_agents
-        from jinja2 import Template
-
-        template = Template(KLEAN_SYSTEM_PROMPT)
-        rendered_prompt = template.render(
+        rendered_prompt = _get_system_prompt_template().render(
             tools={t.name: t for t in tools},
             managed_agents={},
             custom_instructions=custom_instructions,
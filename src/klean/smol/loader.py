@@ -5,12 +5,16 @@ Agent prompt loader for SmolKLN.
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
 from klean.discovery import get_model
 
+# YAML frontmatter delimited by --- lines, followed by the markdown body
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
 
 @dataclass
 class AgentConfig:
@@ -37,25 +41,17 @@ class Agent:
     source_path: Path
 
 
-def parse_agent_file(path: Path) -> Agent:
-    """Parse an agent .md file into config and system prompt.
+@lru_cache(maxsize=64)
+def _read_agent_source(path: Path, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """Read and split an agent file into frontmatter dict and markdown body.
 
-    File format:
-    ---
-    name: security-auditor
-    description: Security audit specialist
-    model: glm-4.6-thinking
-    tools: ["knowledge_search", "read_file"]
-    ---
-
-    # System Prompt Content
-    You are a security auditor...
+    Cached on (path, mtime, size) so repeated loads of an unchanged file
+    (planning, agent info, execution) skip the read and YAML parse.
     """
     content = path.read_text()
 
     # Split on YAML frontmatter delimiters
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
 
     if match:
         yaml_content = match.group(1)
@@ -66,11 +62,32 @@ def parse_agent_file(path: Path) -> Agent:
         config_dict = {"name": path.stem, "description": ""}
         markdown_content = content
 
+    return config_dict, markdown_content
+
+
+def parse_agent_file(path: Path) -> Agent:
+    """Parse an agent .md file into config and system prompt.
+
+    File format:
+    ---
+    name: security-auditor
+    description: Security audit specialist
+    model: glm-4.6-thinking
+    tools: ["knowledge_search", "read_file"]
+    ---
+
+    # System Prompt Content
+    You are a security auditor...
+    """
+    stat = path.stat()
+    config_dict, markdown_content = _read_agent_source(path, stat.st_mtime_ns, stat.st_size)
+
+    tools = config_dict.get("tools")
     config = AgentConfig(
         name=config_dict.get("name", path.stem),
         description=config_dict.get("description", ""),
         model=config_dict.get("model", ""),
-        tools=config_dict.get("tools"),
+        tools=list(tools) if isinstance(tools, list) else tools,
     )
 
     # Resolve model: empty, "auto", or "inherit" = first available from LiteLLM
@@ -69,6 +69,25 @@ Rules:
 5. Keep it minimal - don't over-engineer
 """
 
+SYNTHESIS_PROMPT = """Synthesize these agent results into a cohesive response.
+
+## Original Task
+{task}
+
+## Agent Results
+{results}
+
+## Instructions
+1. Identify key findings from each agent
+2. Resolve any conflicts
+3. Provide unified summary with actionable recommendations
+4. Use severity levels: CRITICAL | WARNING | INFO
+"""
+
+
+# Outermost {...} span in planner output (one C-level scan)
+JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 class SmolKLNOrchestrator:
     """Orchestrator for multi-agent task execution.
@@ -168,7 +187,7 @@ class SmolKLNOrchestrator:
     def _parse_plan(self, output: str, task: str) -> TaskPlan:
         """Parse planner output into TaskPlan."""
         # Find JSON in output
-        match = re.search(r"\{[\s\S]*\}", output)
+        match = JSON_OBJECT_RE.search(output)
         if match:
             try:
                 data = json.loads(match.group())
@@ -244,17 +263,17 @@ class SmolKLNOrchestrator:
         """Execute a single subtask with context from dependencies."""
         subtask.status = TaskStatus.RUNNING
 
-        # Build context from dependencies
-        context = ""
+        # Build context from dependencies (collect sections, join once)
+        sections = []
         for dep_id in subtask.dependencies:
             if dep_id in prior_results:
                 dep_output = prior_results[dep_id].get("output", "")
                 # Truncate to avoid context overflow
-                context += f"\n## From task {dep_id}:\n{dep_output[:800]}"
+                sections.append(f"## From task {dep_id}:\n{dep_output[:800]}")
 
-        return self.executor.execute(
-            subtask.agent, subtask.description, context=context.strip() or None
-        )
+        context = "\n".join(sections).strip()
+
+        return self.executor.execute(subtask.agent, subtask.description, context=context or None)
 
     def _synthesize(self, task: str, results: dict) -> str:
         """Synthesize results from multiple agents into cohesive output."""
@@ -272,20 +291,7 @@ class SmolKLNOrchestrator:
                 output = output[:600] + "..."
             formatted.append(f"### Task {tid} ({agent})\n{output}")
 
-        synthesis_prompt = f"""Synthesize these agent results into a cohesive response.
-
-## Original Task
-{task}
-
-## Agent Results
-{chr(10).join(formatted)}
-
-## Instructions
-1. Identify key findings from each agent
-2. Resolve any conflicts
-3. Provide unified summary with actionable recommendations
-4. Use severity levels: CRITICAL | WARNING | INFO
-"""
+        synthesis_prompt = SYNTHESIS_PROMPT.format(task=task, results="\n".join(formatted))
 
         result = self.executor.execute("code-reviewer", synthesis_prompt, max_steps=5)
 
@@ -6,7 +6,7 @@ Provides file-based persistence for background task management.
 import json
 import time
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -73,8 +73,12 @@ class TaskQueue:
         self.db_path.write_text(json.dumps(data, indent=2))
 
     def _to_dict(self, task: QueuedTask) -> dict:
-        """Convert task to dict for JSON serialization."""
-        d = asdict(task)
+        """Convert task to dict for JSON serialization.
+
+        Shallow copy only: json.dumps walks nested results itself, so the
+        recursive deep copy done by dataclasses.asdict() is wasted work.
+        """
+        d = vars(task).copy()
         d["state"] = task.state.value
         return d
 
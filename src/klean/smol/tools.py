@@ -926,6 +926,8 @@ def scan_secrets(path: str = ".", file_pattern: str = "*") -> str:
     Returns:
         List of potential secrets found with file:line references.
     """
+    import fnmatch
+    import os
     import re
     from pathlib import Path
 
@@ -953,11 +955,35 @@ def scan_secrets(path: str = ".", file_pattern: str = "*") -> str:
     # Skip common non-code directories
     skip_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv", ".knowledge-db"}
 
-    for file_path in base.glob(f"**/{file_pattern}"):
-        if any(skip in file_path.parts for skip in skip_dirs):
-            continue
-        if not file_path.is_file():
-            continue
+    def iter_candidate_files():
+        # Same matches as base.glob("**/" + file_pattern), minus skip dirs
+        if "**" in file_pattern:
+            # Recursive patterns need glob itself; filter skip dirs afterwards
+            for file_path in base.glob(f"**/{file_pattern}"):
+                if file_path.is_file() and not skip_dirs.intersection(
+                    file_path.relative_to(base).parts
+                ):
+                    yield file_path
+            return
+
+        # Prune skip dirs before descending instead of walking them and
+        # filtering every match afterwards (.venv/node_modules can be huge).
+        # Like glob's "**", os.walk does not descend into symlinked dirs.
+        has_sep = "/" in file_pattern or os.sep in file_pattern
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+            for name in filenames:
+                file_path = Path(dirpath) / name
+                # Match from the right, per component, with the platform's case
+                # rules (fnmatch.fnmatch normalizes case where glob would)
+                if (
+                    file_path.relative_to(base).match(file_pattern)
+                    if has_sep
+                    else fnmatch.fnmatch(name, file_pattern)
+                ):
+                    yield file_path
+
+    for file_path in iter_candidate_files():
         # Skip binary files
         if file_path.suffix in [".pyc", ".so", ".dll", ".exe", ".bin", ".png", ".jpg", ".gif"]:
             continue
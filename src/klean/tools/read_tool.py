@@ -3,12 +3,42 @@
 This tool allows droids to read file contents for analysis.
 """
 
+import asyncio
+import stat
 from pathlib import Path
 from typing import Any, Optional
 
 from ..tools import tool
 
 
+def _read_line_window(file_path: Path, start: int, count: int) -> tuple[str, bool]:
+    """Read lines [start, start + count) as split("\\n") on the full text would.
+
+    Returns:
+        (content, truncated) where truncated means more lines follow.
+    """
+    end = start + count
+    window = []
+    seen = 0
+    ended_with_newline = True  # an empty file splits to [""]
+    with open(file_path, errors="ignore") as f:
+        for line in f:
+            if seen >= end:
+                return "\n".join(window), True
+            ended_with_newline = line.endswith("\n")
+            if seen >= start:
+                window.append(line[:-1] if ended_with_newline else line)
+            seen += 1
+
+    # split("\n") yields a final empty piece after a trailing newline
+    if ended_with_newline:
+        if seen >= end:
+            return "\n".join(window), True
+        if seen >= start:
+            window.append("")
+    return "\n".join(window), False
+
+
 @tool("read_file", "Read file contents for analysis")
 async def read_file(
     path: str,
@@ -46,31 +76,40 @@ async def read_file(
     try:
         file_path = Path(path)
 
-        if not file_path.exists():
+        # One stat answers both "exists" and "is a regular file"
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             return {
                 "error": f"File not found: {path}",
                 "path": str(file_path),
             }
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {
                 "error": f"Path is not a file: {path}",
                 "path": str(file_path),
             }
 
-        # Read file content
-        content = file_path.read_text(errors="ignore")
-
-        # Apply line limits if requested
-        if offset or lines:
-            content_lines = content.split("\n")
-            start = offset or 0
-            end = start + (lines or len(content_lines))
-            content_lines = content_lines[start:end]
-            truncated = end < len(content.split("\n"))
-            content = "\n".join(content_lines)
+        # Read off the event loop so concurrent tools keep running
+        if lines and lines > 0 and (offset or 0) >= 0:
+            # Bounded read: stop once the requested window (plus one line to
+            # detect truncation) has been seen instead of loading the file
+            content, truncated = await asyncio.to_thread(
+                _read_line_window, file_path, offset or 0, lines
+            )
         else:
-            truncated = False
+            content = await asyncio.to_thread(file_path.read_text, errors="ignore")
+
+            # Apply line limits if requested
+            if offset or lines:
+                content_lines = content.split("\n")
+                start = offset or 0
+                end = start + (lines or len(content_lines))
+                truncated = end < len(content_lines)
+                content = "\n".join(content_lines[start:end])
+            else:
+                truncated = False
 
         return {
             "content": content,
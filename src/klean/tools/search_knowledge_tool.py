@@ -4,6 +4,7 @@ This tool allows droids to query the knowledge database in real-time during anal
 Uses TCP connection to the knowledge server (cross-platform).
 """
 
+import asyncio
 from typing import Any
 
 from ..tools import tool
@@ -74,8 +75,8 @@ async def search_knowledge(
                 "query": query,
             }
 
-        # Query via TCP
-        result = search(project_path, query, limit=limit)
+        # Query via TCP (blocking socket I/O, so keep it off the event loop)
+        result = await asyncio.to_thread(search, project_path, query, limit=limit)
 
         if result is None:
             return {
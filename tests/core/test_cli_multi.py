@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""cli_multi text output tests.
+
+The INDIVIDUAL REVIEWS section lists one line per successful model call.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add klean data/core to path for klean_core module
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "src",
+        "klean",
+        "data",
+        "core",
+    ),
+)
+
+from klean_core import cli_multi
+
+
+def create_mock_response(content, model="test-model"):
+    """Helper to create a mock litellm response."""
+    mock_message = MagicMock()
+    mock_message.content = content
+    mock_message.reasoning_content = None
+
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
+
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage = None
+    mock_response.model = model
+    return mock_response
+
+
+class TestCliMultiIndividualReviews(unittest.TestCase):
+    """INDIVIDUAL REVIEWS lines in cli_multi text output."""
+
+    @patch("klean_core.litellm.acompletion", new_callable=AsyncMock)
+    def test_repeated_model_lines_show_their_own_review(self, mock_acompletion):
+        """Should print each response's grade when a model is listed twice."""
+        mock_acompletion.side_effect = [
+            create_mock_response(json.dumps({"grade": "A", "risk": "LOW", "findings": []})),
+            create_mock_response(
+                json.dumps(
+                    {
+                        "grade": "C",
+                        "risk": "HIGH",
+                        "findings": [{"severity": "HIGH", "location": "a.py:1", "issue": "bug"}],
+                    }
+                )
+            ),
+        ]
+
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write("print('hello')\n")
+        self.addCleanup(os.unlink, f.name)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cli_multi(["--models", "model-a,model-a", "-c", f.name])
+
+        lines = output.getvalue().split("INDIVIDUAL REVIEWS")[1].splitlines()
+        review_lines = [line for line in lines if "Grade:" in line]
+        self.assertEqual(len(review_lines), 2)
+        self.assertIn("Grade:A Risk:LOW Findings:0", review_lines[0])
+        self.assertIn("Grade:C Risk:HIGH Findings:1", review_lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
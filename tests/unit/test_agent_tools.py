@@ -173,6 +173,19 @@ class TestReadFile:
         assert "Line 2" in result["content"]
         assert "Line 0" not in result["content"]
 
+    def test_line_window_at_end_not_truncated(self, tmp_path):
+        """Should report no truncation when the window reaches end of file."""
+        from klean.tools.read_tool import read_file
+
+        test_file = tmp_path / "tail.txt"
+        test_file.write_text("Line 0\nLine 1\nLine 2\n")
+
+        result = asyncio.run(read_file(str(test_file), offset=2, lines=5))
+
+        # Same pieces as splitting the whole text on "\n"
+        assert result["content"] == "Line 2\n"
+        assert result["truncated"] is False
+
 
 # =============================================================================
 # Search Knowledge Tool Tests
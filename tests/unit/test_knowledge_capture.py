@@ -0,0 +1,163 @@
+"""Unit tests for klean.data.scripts.knowledge-capture script.
+
+Tests the JSON array input mode and entry ids:
+- A batch is saved with one JSONL write and one timeline write
+- Empty arrays write nothing
+- Non-object items are rejected as invalid JSON
+- new_entry_id stays unique within one process
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "src/klean/data/scripts"
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    """knowledge-capture module with the server and KnowledgeDB paths disabled."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location(
+        "knowledge_capture", SCRIPTS_DIR / "knowledge-capture.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Force the JSONL-only fallback: no server, KnowledgeDB not importable
+    monkeypatch.setattr(module, "send_entry_to_server", lambda entry, project_path: False)
+    monkeypatch.setitem(sys.modules, "knowledge_db", None)
+    return module
+
+
+@pytest.fixture
+def init(capture, tmp_path, monkeypatch):
+    """InitResult for a temporary .knowledge-db, returned by get_knowledge_dir."""
+    kb_dir = tmp_path / ".knowledge-db"
+    kb_dir.mkdir()
+    result = capture.InitResult(kb_dir)
+    monkeypatch.setattr(capture, "get_knowledge_dir", lambda: result)
+    return result
+
+
+@pytest.fixture
+def writes(capture, monkeypatch):
+    """Record the path of every append_line call."""
+    calls = []
+    append_line = capture.append_line
+
+    def spy(path, line):
+        calls.append(path)
+        append_line(path, line)
+
+    monkeypatch.setattr(capture, "append_line", spy)
+    return calls
+
+
+def run_main(capture, monkeypatch, *args):
+    """Run main() with the given command-line arguments."""
+    monkeypatch.setattr(sys, "argv", ["knowledge-capture.py", *args])
+    return capture.main()
+
+
+# =============================================================================
+# TestCaptureBatch
+# =============================================================================
+
+
+class TestCaptureBatch:
+    """Tests for --json-input with a JSON array."""
+
+    def test_array_saves_entries_in_one_write_each(
+        self, capture, init, writes, monkeypatch, capsys
+    ):
+        """Should save N entries with unique ids in one JSONL and one timeline write."""
+        # Arrange
+        items = [
+            {"title": f"Entry {i}", "insight": f"Insight {i}", "type": "finding"} for i in range(3)
+        ]
+
+        # Act
+        code = run_main(capture, monkeypatch, "--json-input", json.dumps(items), "--json")
+
+        # Assert
+        assert code == 0
+        assert writes == [init.entries_file, init.timeline_file]
+        with open(init.entries_file) as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        assert [e["title"] for e in entries] == ["Entry 0", "Entry 1", "Entry 2"]
+        assert len({e["id"] for e in entries}) == 3
+        assert len(init.timeline_file.read_text().splitlines()) == 3
+        output = json.loads(capsys.readouterr().out)
+        assert output["count"] == 3
+        assert output["ids"] == [e["id"] for e in entries]
+
+    def test_empty_array_writes_nothing(self, capture, init, writes, monkeypatch, capsys):
+        """Should return 0 without touching entries.jsonl or timeline.txt."""
+        # Act
+        code = run_main(capture, monkeypatch, "--json-input", "[]", "--json")
+
+        # Assert
+        assert code == 0
+        assert writes == []
+        assert not init.entries_file.exists()
+        assert not init.timeline_file.exists()
+        assert json.loads(capsys.readouterr().out)["count"] == 0
+
+    @pytest.mark.parametrize("payload", ["[1]", '"str"', '[{"title": "ok"}, "str"]'])
+    def test_non_object_input_is_invalid(self, capture, init, writes, monkeypatch, capsys, payload):
+        """Should return 1 with an Invalid JSON error and write nothing."""
+        # Act
+        code = run_main(capture, monkeypatch, "--json-input", payload)
+
+        # Assert
+        assert code == 1
+        assert writes == []
+        assert "Invalid JSON" in capsys.readouterr().err
+
+    def test_non_object_input_json_error(self, capture, init, monkeypatch, capsys):
+        """Should report the Invalid JSON error as JSON with --json."""
+        # Act
+        code = run_main(capture, monkeypatch, "--json-input", "[1]", "--json")
+
+        # Assert
+        assert code == 1
+        assert json.loads(capsys.readouterr().out)["error"].startswith("Invalid JSON")
+
+
+# =============================================================================
+# TestNewEntryId
+# =============================================================================
+
+
+class TestNewEntryId:
+    """Tests for new_entry_id."""
+
+    def test_ids_are_unique_within_a_process(self, capture):
+        """Should not collide for ids generated back to back."""
+        # Act
+        ids = [capture.new_entry_id("finding") for _ in range(1000)]
+
+        # Assert
+        assert len(set(ids)) == 1000
+
+    def test_id_format(self, capture):
+        """Should be "<type>-<ns>-<pid>-<seq>" with hex numbers."""
+        # Act
+        entry_type, ns, pid, seq = capture.new_entry_id("warning").split("-")
+
+        # Assert
+        assert entry_type == "warning"
+        assert int(pid, 16) == os.getpid()
+        int(ns, 16)
+        int(seq, 16)
@@ -13,7 +13,9 @@ ANTI-FALSE-POSITIVE MEASURES:
 4. Check file persistence (sparse_index.json)
 """
 
+import hashlib
 import json
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -65,6 +67,30 @@ def sample_entries():
     ]
 
 
+class FakeDenseModel:
+    """Offline stand-in for the BGE model: unit vectors seeded by each text."""
+
+    def embed(self, texts, **kwargs):
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+            vector = np.random.default_rng(seed).standard_normal(384).astype(np.float32)
+            yield vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def knowledge_db(monkeypatch):
+    """knowledge_db module with offline models (fake dense, no sparse or reranker)."""
+    scripts_dir = str(Path(__file__).parent.parent.parent / "src/klean/data/scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    import knowledge_db
+
+    monkeypatch.setattr(knowledge_db, "get_dense_model", FakeDenseModel)
+    monkeypatch.setattr(knowledge_db, "get_sparse_model", lambda: None)
+    monkeypatch.setattr(knowledge_db, "get_reranker", lambda: None)
+    return knowledge_db
+
+
 @pytest.fixture
 def kb_with_entries(temp_kb_dir, sample_entries):
     """Create KB directory with sample entries."""
@@ -156,6 +182,32 @@ class TestRRFScore:
         assert score_k20 > score_k60
 
 
+# =============================================================================
+# TestEmbeddingThreads
+# =============================================================================
+
+
+class TestEmbeddingThreads:
+    """Tests for KLEAN_EMB_THREADS parsing."""
+
+    def test_positive_value_sets_threads(self, knowledge_db, monkeypatch):
+        """Should use a positive integer as the thread count."""
+        # Arrange
+        monkeypatch.setenv("KLEAN_EMB_THREADS", "4")
+
+        # Act & Assert
+        assert knowledge_db._embedding_threads() == 4
+
+    @pytest.mark.parametrize("value", ["", "four", "2.5", "0", "-1"])
+    def test_invalid_value_falls_back_to_default(self, knowledge_db, monkeypatch, value):
+        """Should fall back to fastembed's default instead of raising."""
+        # Arrange
+        monkeypatch.setenv("KLEAN_EMB_THREADS", value)
+
+        # Act & Assert
+        assert knowledge_db._embedding_threads() is None
+
+
 # =============================================================================
 # TestSparseIndexPersistence
 # =============================================================================
@@ -295,6 +347,116 @@ class TestHybridSearch:
             # Assert
             assert len(results) <= 2
 
+    def test_repeated_search_served_from_cache(self, knowledge_db, kb_with_entries):
+        """Should embed a repeated query once and drop cached results on add."""
+
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        model = db.dense_model
+
+        # Act
+        with patch.object(model, "embed", wraps=model.embed) as spy:
+            first = db.search("BLE power")
+            dense_rank = first[0]["_search_meta"]["dense_rank"]
+            keywords = list(first[0]["keywords"])
+            first[0]["score"] = -1
+            first[0]["_search_meta"]["dense_rank"] = -1
+            first[0]["keywords"].append("MUT")
+            second = db.search("BLE power")
+            second[0]["_search_meta"]["dense_rank"] = -2
+            third = db.search("BLE power")
+
+            # Assert
+            assert spy.call_count == 1
+            assert second[0]["score"] > 0
+            assert second[0]["keywords"] == keywords
+            assert db.get(first[0]["id"])["keywords"] == keywords
+            assert third[0]["_search_meta"]["dense_rank"] == dense_rank
+
+            db.add({"title": "BLE power budget", "summary": "Sleep current"})
+            spy.reset_mock()
+            db.search("BLE power")
+            assert spy.call_count == 1
+
+    def test_search_overlapping_add_does_not_cache_stale_results(
+        self, knowledge_db, kb_with_entries
+    ):
+        """Should not cache results a search computed before a concurrent add."""
+        import threading
+
+        # Arrange - pause one search mid-flight while another thread adds
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        entry = {"id": "late", "title": "Late entry", "insight": "Added mid-search"}
+        query = "Late entry Added mid-search"
+        computed, release = threading.Event(), threading.Event()
+        dense_search = db._dense_search
+
+        def paused_dense_search(*args):
+            hits = dense_search(*args)
+            computed.set()
+            release.wait(5)
+            return hits
+
+        db._dense_search = paused_dense_search
+        searcher = threading.Thread(target=db.search, args=(query,), kwargs={"limit": 1})
+
+        # Act
+        searcher.start()
+        assert computed.wait(5)
+        db.add(entry, check_duplicates=False)
+        release.set()
+        searcher.join()
+        db._dense_search = dense_search
+
+        # Assert
+        assert db.search(query, limit=1)[0]["id"] == "late"
+
+    def test_concurrent_search_and_add_never_serve_stale_results(
+        self, knowledge_db, kb_with_entries, monkeypatch
+    ):
+        """Should keep the cache consistent when searches overlap adds in other threads."""
+        import threading
+
+        # Arrange - a tiny cache so concurrent searches also evict
+        monkeypatch.setattr(knowledge_db.KnowledgeDB, "QUERY_CACHE_SIZE", 2)
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        new_entries = [
+            {"id": f"new-{i}", "title": f"Concurrent entry {i}", "insight": f"Insight {i}"}
+            for i in range(20)
+        ]
+        queries = [f"{e['title']} {e['insight']}" for e in new_entries]
+        errors = []
+        done = threading.Event()
+
+        def search_loop():
+            try:
+                while not done.is_set():
+                    for query in queries:
+                        db.search(query, limit=1)
+            except Exception as e:  # surfaced by the assert below
+                errors.append(e)
+
+        # Act
+        searchers = [threading.Thread(target=search_loop) for _ in range(4)]
+        for thread in searchers:
+            thread.start()
+        try:
+            for entry in new_entries:
+                db.add(entry, check_duplicates=False)
+        finally:
+            done.set()
+            for thread in searchers:
+                thread.join()
+
+        # Assert - every added entry is found by its own text, not a cached miss
+        assert errors == []
+        for entry, query in zip(new_entries, queries):
+            assert db._build_searchable_text(db.get(entry["id"])) == query
+            assert db.search(query, limit=1)[0]["id"] == entry["id"]
+
 
 # =============================================================================
 # TestDenseSearch
@@ -374,6 +536,74 @@ class TestStats:
             assert "has_sparse_index" in stats
             assert "sparse_entries" in stats
 
+    def test_stats_reuses_size_until_next_write(self, knowledge_db, kb_with_entries):
+        """Should skip the directory walk on repeated calls until the index is saved."""
+
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        first = db.stats()
+
+        # Act
+        (kb_with_entries / "extra.bin").write_bytes(b"x" * 4096)
+        cached = db.stats()
+        db.add({"title": "New entry", "summary": "Forces a save"}, check_duplicates=False)
+        refreshed = db.stats()
+
+        # Assert
+        assert cached["size_bytes"] == first["size_bytes"]
+        assert refreshed["size_bytes"] >= first["size_bytes"] + 4096
+        assert refreshed["count"] == 4
+
+    def test_stats_refreshes_size_after_jsonl_rewrite(self, knowledge_db, kb_with_entries):
+        """Should walk again after paths that only rewrite entries.jsonl."""
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        first = db.stats()
+        entry_id = db.search("Python", limit=1)[0]["id"]
+
+        # Act
+        db.update_usage([entry_id])
+        after_usage = db.stats()
+        with open(db.jsonl_path, "a") as f:
+            f.write(json.dumps({"id": "external", "title": "Written by another process"}) + "\n")
+        after_external = db.stats()
+
+        # Assert
+        assert after_usage["size_bytes"] > first["size_bytes"]
+        assert after_external["size_bytes"] > after_usage["size_bytes"]
+
+    def test_stats_refreshes_size_after_timeline_write(self, knowledge_db, kb_with_entries):
+        """Should walk again after knowledge-capture or hooks append to timeline.txt."""
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        first = db.stats()
+
+        # Act
+        with open(kb_with_entries / "timeline.txt", "a") as f:
+            f.write("x" * 5000)
+        refreshed = db.stats()
+
+        # Assert
+        assert refreshed["size_bytes"] == first["size_bytes"] + 5000
+
+    def test_stats_walks_again_after_ttl(self, knowledge_db, kb_with_entries, monkeypatch):
+        """Should bound staleness for files outside the signature by STATS_SIZE_TTL."""
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        first = db.stats()
+        (kb_with_entries / "extra.bin").write_bytes(b"x" * 4096)
+
+        # Act
+        monkeypatch.setattr(knowledge_db.KnowledgeDB, "STATS_SIZE_TTL", 0.0)
+        refreshed = db.stats()
+
+        # Assert
+        assert refreshed["size_bytes"] == first["size_bytes"] + 4096
+
 
 # =============================================================================
 # TestRebuildIndex
@@ -420,6 +650,31 @@ class TestRebuildIndex:
             assert (kb_with_entries / "embeddings.npy").exists()
             assert (kb_with_entries / "index.json").exists()
 
+    def test_rebuild_only_embeds_new_entries(self, knowledge_db, kb_with_entries):
+        """Should reuse vectors of unchanged entries from the loaded index."""
+
+        knowledge_db.KnowledgeDB(str(kb_with_entries.parent)).rebuild_index(dense_only=True)
+
+        # Entry appended to JSONL only (e.g. capture fallback)
+        with open(kb_with_entries / "entries.jsonl", "a") as f:
+            f.write(json.dumps({"id": "entry-4", "title": "Rust", "summary": "Ownership"}))
+            f.write("\n")
+
+        # Act
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        with patch.object(db.dense_model, "embed", wraps=db.dense_model.embed) as spy:
+            count = db.rebuild_index(dense_only=True)
+
+        # Assert
+        embedded = [text for call in spy.call_args_list for text in call.args[0]]
+        assert count == 4
+        assert len(embedded) == 1
+        assert "Rust" in embedded[0]
+        assert db._embeddings.shape[0] == 4
+        for entry in db._entries:
+            row = db._embeddings[db._id_to_row[entry["id"]]]
+            assert np.allclose(row, db._embed_one(db._build_searchable_text(entry)))
+
 
 # =============================================================================
 # TestAddEntry
@@ -473,6 +728,181 @@ class TestAddEntry:
                 lines = [line for line in f if line.strip()]
             assert len(lines) == 2
 
+    def test_add_after_rebuild_keeps_existing_rows(self, knowledge_db, kb_with_entries):
+        """Should append after rebuilt rows without losing or reordering them."""
+
+        # Act
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.rebuild_index()
+        rebuilt = db._embeddings.copy()
+        db.add({"title": "Extra entry", "insight": "Added after rebuild"}, check_duplicates=False)
+
+        # Assert
+        assert db._embeddings.shape[0] == 4
+        assert np.array_equal(db._embeddings[:3], rebuilt)
+        assert np.load(str(kb_with_entries / "embeddings.npy")).shape[0] == 4
+
+    def test_add_appends_rows_to_saved_embeddings_file(self, knowledge_db, kb_with_entries):
+        """Should grow embeddings.npy in place instead of rewriting it."""
+
+        # Arrange
+        knowledge_db.KnowledgeDB(str(kb_with_entries.parent)).rebuild_index()
+        embeddings_path = kb_with_entries / "embeddings.npy"
+        inode = embeddings_path.stat().st_ino
+
+        # Act
+        db = knowledge_db.KnowledgeDB(str(kb_with_entries.parent))
+        db.add_many(
+            [
+                {"title": "Extra entry", "insight": "Appended row"},
+                {"title": "Another entry", "insight": "Second appended row"},
+            ],
+            check_duplicates=False,
+        )
+
+        # Assert
+        assert embeddings_path.stat().st_ino == inode
+        saved = np.load(str(embeddings_path))
+        assert saved.shape == (5, db._embeddings.shape[1])
+        assert np.array_equal(saved, db._embeddings)
+        assert knowledge_db.KnowledgeDB(str(kb_with_entries.parent)).count() == 5
+
+    def test_add_many_embeds_and_appends_batch(self, knowledge_db, temp_kb_dir):
+        """Should add a batch in input order with one JSONL line per entry."""
+
+        # Act
+        db = knowledge_db.KnowledgeDB(str(temp_kb_dir.parent))
+        entry_ids = db.add_many(
+            [
+                {"id": "batch-1", "title": "Entry 1", "summary": "Summary 1"},
+                {"id": "batch-2", "title": "Entry 2", "insight": "Insight 2"},
+            ],
+            check_duplicates=False,
+        )
+
+        # Assert
+        assert entry_ids == ["batch-1", "batch-2"]
+        assert db._embeddings.shape[0] == 2
+        assert db._id_to_row == {"batch-1": 0, "batch-2": 1}
+        with open(temp_kb_dir / "entries.jsonl") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        assert [e["id"] for e in lines] == ["batch-1", "batch-2"]
+        assert lines[0]["insight"] == "Summary 1"
+
+    def test_add_many_keeps_rows_aligned_with_entries(self, knowledge_db, temp_kb_dir):
+        """Should store each embedding on its entry's row whatever the text lengths."""
+
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(temp_kb_dir.parent))
+        entries = [
+            {"id": "long", "title": "A much longer title", "summary": "And a longer summary"},
+            {"id": "short", "title": "Short", "summary": "Tiny"},
+            {"id": "medium", "title": "Medium title", "summary": "Some summary"},
+        ]
+
+        # Act
+        db.add_many(entries, check_duplicates=False)
+
+        # Assert
+        for entry in entries:
+            text = db._build_searchable_text(db.get(entry["id"]))
+            row = db._embeddings[db._id_to_row[entry["id"]]]
+            assert np.allclose(row, db._embed_one(text))
+
+    def test_add_reuses_jsonl_handle_across_rewrites(self, knowledge_db, temp_kb_dir):
+        """Should keep one append handle and still append after the file is rewritten."""
+
+        # Act
+        db = knowledge_db.KnowledgeDB(str(temp_kb_dir.parent))
+        db.add({"id": "e1", "title": "Entry 1", "summary": "Summary 1"})
+        writer = db._jsonl_writer
+        db.update_usage(["e1"])
+        db.add({"id": "e2", "title": "Entry 2", "summary": "Summary 2"})
+
+        # Assert
+        assert db._jsonl_writer is writer
+        with open(temp_kb_dir / "entries.jsonl") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        assert [e["id"] for e in lines] == ["e1", "e2"]
+        assert lines[0]["usage_count"] == 1
+
+        db.close()
+        assert writer.closed
+
+    def test_context_manager_closes_jsonl_handle(self, knowledge_db, temp_kb_dir):
+        """Should close the append handle when leaving a with block."""
+        # Act
+        with knowledge_db.KnowledgeDB(str(temp_kb_dir.parent)) as db:
+            db.add({"id": "e1", "title": "Entry 1", "summary": "Summary 1"})
+            writer = db._jsonl_writer
+
+        # Assert
+        assert writer.closed
+        assert db._jsonl_writer is None
+
+    def test_nan_entry_survives_reload_and_update_usage(
+        self, knowledge_db, temp_kb_dir, monkeypatch
+    ):
+        """Should keep NaN entries that a strict parser such as orjson rejects."""
+
+        def strict_loads(s):
+            def reject(constant):
+                raise json.JSONDecodeError(f"invalid constant {constant}", s, 0)
+
+            return json.loads(s, parse_constant=reject)
+
+        # Arrange - stand in for orjson, which rejects NaN
+        monkeypatch.setattr(knowledge_db, "json_loads", strict_loads)
+        with knowledge_db.KnowledgeDB(str(temp_kb_dir.parent)) as db:
+            db.add({"id": "a", "title": "Entry A", "summary": "Summary A"})
+            db.add(
+                {
+                    "id": "b",
+                    "title": "Entry B",
+                    "summary": "Summary B",
+                    "confidence_score": float("nan"),
+                }
+            )
+            db.add({"id": "c", "title": "Entry C", "summary": "Summary C"})
+
+        # Act
+        db = knowledge_db.KnowledgeDB(str(temp_kb_dir.parent))
+        updated = db.update_usage(["b"])
+
+        # Assert
+        assert len(db._entries) == len(db._embeddings) == 3
+        assert db.get("b")["title"] == "Entry B"
+        assert db._entries[db._id_to_row["c"]]["id"] == "c"
+        assert updated == 1
+        with open(temp_kb_dir / "entries.jsonl") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        assert [e["id"] for e in lines] == ["a", "b", "c"]
+        assert lines[1]["usage_count"] == 1
+        db.close()
+
+    def test_get_reads_cached_entries_and_falls_back_to_jsonl(self, knowledge_db, temp_kb_dir):
+        """Should serve indexed ids from memory and scan the JSONL for others."""
+
+        # Arrange
+        db = knowledge_db.KnowledgeDB(str(temp_kb_dir.parent))
+        db.add(
+            {"id": "cached-1", "title": "Cached", "summary": "In memory", "keywords": ["ble"]}
+        )
+        with open(temp_kb_dir / "entries.jsonl", "a") as f:
+            f.write(json.dumps({"id": "external-1", "title": "External"}) + "\n")
+
+        # Act
+        cached = db.get("cached-1")
+        cached["title"] = "Changed"
+        cached["keywords"].append("MUT")
+
+        # Assert
+        assert db.get("cached-1")["title"] == "Cached"
+        assert db.get("cached-1")["keywords"] == ["ble"]
+        assert db._entries_by_id["cached-1"]["keywords"] == ["ble"]
+        assert db.get("external-1")["title"] == "External"
+        assert db.get("missing") is None
+
 
 # =============================================================================
 # TestInferType
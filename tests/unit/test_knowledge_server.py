@@ -90,6 +90,30 @@ class TestGetServerPort:
             result = kb_utils.get_server_port(project)
             assert result == 14567
 
+    def test_rereads_port_after_file_change(self, tmp_path):
+        """Should not serve a cached port once the port file is rewritten."""
+        import os
+
+        kb_utils = get_kb_utils()
+
+        project = tmp_path / "project"
+        project.mkdir()
+
+        port_file = tmp_path / "test.port"
+        port_file.write_text("14567")
+        os.utime(port_file, ns=(1_000_000_000, 1_000_000_000))
+
+        with patch.object(kb_utils, "get_kb_port_file", return_value=port_file):
+            assert kb_utils.get_server_port(project) == 14567
+
+            # Server restarted on a new port
+            port_file.write_text("14568")
+            os.utime(port_file, ns=(2_000_000_000, 2_000_000_000))
+            assert kb_utils.get_server_port(project) == 14568
+
+            port_file.unlink()
+            assert kb_utils.get_server_port(project) is None
+
 
 # =============================================================================
 # Server Status Tests
@@ -127,6 +151,42 @@ class TestIsServerRunning:
                 result = kb_utils.is_server_running(project, timeout=0.1)
                 assert result is False
 
+    def test_recent_pong_skips_second_probe(self, tmp_path):
+        """Should reuse a successful ping within the status TTL."""
+        kb_utils = get_kb_utils()
+
+        project = tmp_path / "project"
+        project.mkdir()
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        server.settimeout(2.0)
+        port = server.getsockname()[1]
+
+        def one_shot_server():
+            try:
+                conn, _ = server.accept()
+                conn.recv(1024)
+                conn.sendall(b'{"pong":true}')
+                conn.close()
+            except socket.timeout:
+                pass
+            finally:
+                server.close()
+
+        server_thread = threading.Thread(target=one_shot_server)
+        server_thread.start()
+
+        try:
+            with patch.object(kb_utils, "get_server_port", return_value=port):
+                assert kb_utils.is_server_running(project) is True
+                server_thread.join(timeout=3.0)
+                # Listener is gone; only the cached pong can answer this
+                assert kb_utils.is_server_running(project) is True
+        finally:
+            server_thread.join(timeout=3.0)
+
 
 class TestTcpCommunication:
     """Tests for TCP socket communication."""
@@ -197,6 +257,43 @@ class TestTcpCommunication:
         finally:
             server_thread.join(timeout=3.0)
 
+    def test_send_command_reads_large_response(self, tmp_path):
+        """Should read responses larger than a single recv() buffer."""
+        kb_utils = get_kb_utils()
+
+        project = tmp_path / "project"
+        project.mkdir()
+
+        payload = {"results": [{"title": "x" * 1000, "id": i} for i in range(200)]}
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        server.settimeout(2.0)
+        port = server.getsockname()[1]
+
+        def one_shot_server():
+            try:
+                conn, _ = server.accept()
+                conn.recv(4096)
+                conn.sendall(json.dumps(payload).encode())
+                conn.close()
+            except socket.timeout:
+                pass
+            finally:
+                server.close()
+
+        server_thread = threading.Thread(target=one_shot_server)
+        server_thread.start()
+
+        try:
+            with patch.object(kb_utils, "get_server_port", return_value=port):
+                result = kb_utils.send_command(project, {"cmd": "search", "query": "x"})
+
+            assert result == payload
+        finally:
+            server_thread.join(timeout=3.0)
+
 
 # =============================================================================
 # Knowledge DB Initialization Tests
@@ -185,6 +185,37 @@ class TestParseAgentFile:
         # Assert
         assert agent.config.model == "auto"
 
+    @patch("klean.smol.loader.get_model")
+    def test_reparses_after_file_change(self, mock_get_model, temp_agents_dir):
+        """Should not serve a cached parse once the agent file changes."""
+        # Arrange
+        mock_get_model.return_value = "model"
+        agent_path = temp_agents_dir / "security-auditor.md"
+        first = parse_agent_file(agent_path)
+
+        # Act - rewrite with different content (size changes too)
+        agent_path.write_text("---\nname: renamed\ndescription: Changed\n---\n\n# Renamed\n")
+        second = parse_agent_file(agent_path)
+
+        # Assert
+        assert first.config.name == "security-auditor"
+        assert second.config.name == "renamed"
+        assert second.system_prompt == "# Renamed"
+
+    @patch("klean.smol.loader.get_model")
+    def test_cached_tools_not_shared(self, mock_get_model, temp_agents_dir):
+        """Mutating one parsed agent's tools should not leak into the next parse."""
+        # Arrange
+        mock_get_model.return_value = "model"
+        agent_path = temp_agents_dir / "security-auditor.md"
+
+        # Act
+        parse_agent_file(agent_path).config.tools.append("web_search")
+        agent = parse_agent_file(agent_path)
+
+        # Assert
+        assert "web_search" not in agent.config.tools
+
 
 class TestListAvailableAgents:
     """Tests for list_available_agents() function."""
@@ -241,6 +241,30 @@ class TestQuickReview:
                     assert result.success is False
                     assert result.error is not None
 
+    async def test_skips_health_probe_when_disabled(self):
+        """Should go straight to the review when check_health=False."""
+        from klean.reviews import quick_review
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"choices": [{"message": {"content": "Grade: B"}}]}
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+
+        with patch("klean.reviews._check_model_health") as mock_health:
+            result = await quick_review(
+                model="test-model",
+                focus="Review",
+                context="code",
+                client=mock_client,
+                check_health=False,
+            )
+
+            mock_health.assert_not_called()
+            assert result.success is True
+            assert mock_client.post.await_count == 1
+
 
 # =============================================================================
 # Consensus Review Tests
@@ -376,6 +400,35 @@ class TestSecondOpinion:
                 # Should succeed with fallback
                 assert result.success is True
 
+    async def test_reuses_client_for_review(self):
+        """Should pass its own HTTP client to quick_review instead of opening another."""
+        from klean.reviews import second_opinion
+
+        with patch("klean.reviews.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            mock_client_class.return_value = mock_client
+
+            with patch("klean.reviews._check_model_health", return_value=True):
+                with patch("klean.reviews.quick_review") as mock_quick:
+                    from klean.reviews import ReviewResult
+
+                    mock_quick.return_value = ReviewResult(
+                        model="primary-model",
+                        content="Review",
+                        success=True,
+                    )
+
+                    await second_opinion(
+                        focus="Review",
+                        context="code",
+                        primary_model="primary-model",
+                    )
+
+                    assert mock_client_class.call_count == 1
+                    assert mock_quick.call_args.kwargs["client"] is mock_client
+
 
 # =============================================================================
 # Git Diff Tests
@@ -0,0 +1,101 @@
+"""Unit tests for klean.smol.tools scan_secrets file selection.
+
+scan_secrets walks the tree itself so it can prune skipped directories.
+These tests pin its file selection to what glob("**/" + file_pattern)
+matched before, minus the skipped directories.
+"""
+
+import os
+import re
+
+import pytest
+
+from klean.smol.tools import scan_secrets
+
+SECRET_LINE = 'api_key = "abcdefghijklmnopqrstuvwx12345"\n'
+
+
+def _flagged_files(output: str) -> set[str]:
+    """Paths of files with findings in scan_secrets output."""
+    return set(re.findall(r"at `(.+?):\d+`", output))
+
+
+def _glob_files(base, pattern: str) -> set[str]:
+    """Files the previous glob-based scan would have read."""
+    skip_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv", ".knowledge-db"}
+    return {
+        str(p)
+        for p in base.glob(f"**/{pattern}")
+        if p.is_file() and not skip_dirs.intersection(p.relative_to(base).parts)
+    }
+
+
+@pytest.fixture
+def secrets_tree(tmp_path):
+    """Project tree with one secret per file, including a skipped dir."""
+    base = tmp_path / "project"
+    for rel in [
+        "app.py",
+        "Upper.PY",
+        "src/main.py",
+        "src/notes.txt",
+        "lib/src/util.py",
+        "lib/deep/mod.py",
+        "node_modules/pkg/index.py",
+    ]:
+        file_path = base / rel
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(SECRET_LINE)
+    return base
+
+
+class TestScanSecretsFileSelection:
+    """Tests for which files scan_secrets reads."""
+
+    def test_pattern_with_directory_matches_like_glob(self, secrets_tree):
+        """Should match patterns containing '/' against the relative path."""
+        # Act
+        output = scan_secrets(str(secrets_tree), "src/*.py")
+
+        # Assert
+        flagged = _flagged_files(output)
+        assert flagged == _glob_files(secrets_tree, "src/*.py")
+        assert str(secrets_tree / "lib" / "src" / "util.py") in flagged
+
+    def test_recursive_pattern_matches_like_glob(self, secrets_tree):
+        """Should support '**' inside the pattern and still skip excluded dirs."""
+        # Act
+        output = scan_secrets(str(secrets_tree), "lib/**/*.py")
+
+        # Assert
+        assert _flagged_files(output) == _glob_files(secrets_tree, "lib/**/*.py")
+
+    def test_case_follows_platform_like_glob(self, secrets_tree):
+        """Should apply the same case rules as glob on this platform."""
+        # Act
+        output = scan_secrets(str(secrets_tree), "*.py")
+
+        # Assert
+        flagged = _flagged_files(output)
+        assert flagged == _glob_files(secrets_tree, "*.py")
+        assert not any("node_modules" in path for path in flagged)
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unavailable")
+    def test_symlinked_dirs_not_followed_like_glob(self, secrets_tree, tmp_path):
+        """Should not descend into symlinked directories, as glob's '**' does not."""
+        # Arrange
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "leak.py").write_text(SECRET_LINE)
+        try:
+            os.symlink(outside, secrets_tree / "linked", target_is_directory=True)
+        except OSError:
+            pytest.skip("cannot create symlinks here")
+
+        # Act
+        output = scan_secrets(str(secrets_tree), "*.py")
+
+        # Assert
+        flagged = _flagged_files(output)
+        assert flagged == _glob_files(secrets_tree, "*.py")
+        assert not any("leak.py" in path for path in flagged)